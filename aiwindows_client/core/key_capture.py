@@ -5,10 +5,10 @@ AILinux Key Capture Utilities
 Provides key capture functionality for widgets with proper focus handling.
 """
 import logging
-from typing import Optional, Set, Dict, Callable
+from typing import Optional, Set, Dict, Callable, Tuple
 from dataclasses import dataclass
 
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtCore import Qt, QEvent, QTimer
 from PyQt6.QtGui import QKeyEvent
 from PyQt6.QtWidgets import QWidget
 
@@ -16,8 +16,26 @@ from .shortcut_manager import ShortcutContext, get_shortcut_manager
 
 logger = logging.getLogger("ailinux.key_capture")
 
+# Modifier values resolved once (PyQt6 flags expose their int via .value)
+_NO_MOD = Qt.KeyboardModifier.NoModifier.value
+_CTRL = Qt.KeyboardModifier.ControlModifier.value
+_SHIFT = Qt.KeyboardModifier.ShiftModifier.value
+_ALT = Qt.KeyboardModifier.AltModifier.value
 
-@dataclass
+# Binding keys consulted by handle_event() for focus-changing Tab keys
+_TAB = Qt.Key.Key_Tab
+_BACKTAB = Qt.Key.Key_Backtab
+_TAB_KEY = (_TAB, _NO_MOD)
+_BACKTAB_KEY = (_BACKTAB, _SHIFT)
+_BACKTAB_PLAIN = (_BACKTAB, _NO_MOD)
+
+
+def _mod_value(modifiers) -> int:
+    """Convert a modifier flag (or plain int) to its int value"""
+    return modifiers if isinstance(modifiers, int) else modifiers.value
+
+
+@dataclass(slots=True)
 class KeyBinding:
     """A key binding for a widget"""
     key: int
@@ -49,7 +67,8 @@ class KeyCaptureMixin:
     def init_key_capture(
         self,
         context: ShortcutContext,
-        capture_all: bool = False
+        capture_all: bool = False,
+        also_check_global: Optional[bool] = None
     ):
         """
         Initialize key capture for this widget.
@@ -57,14 +76,35 @@ class KeyCaptureMixin:
         Args:
             context: The shortcut context for this widget
             capture_all: If True, capture all key events (for terminal-like widgets)
+            also_check_global: Consult the shortcut manager for context
+                shortcuts (default: True, False for capture_all widgets)
         """
         self._key_context = context
-        self._key_bindings: Dict[tuple, KeyBinding] = {}
+        # Hot-path table: (key, modifiers) -> (callback, consume)
+        self._key_bindings: Dict[tuple, Tuple[Callable, bool]] = {}
+        # Full binding metadata, only used for help output
+        self._help_bindings: Dict[tuple, KeyBinding] = {}
+        # Direct slots for the Tab/Backtab fast path in handle_event()
+        self._tab_callback: Optional[Callable] = None
+        self._backtab_callback: Optional[Callable] = None
         self._capture_all = capture_all
+        self._also_check_global = (
+            not capture_all if also_check_global is None else also_check_global
+        )
         self._pass_through_keys: Set[int] = set()
 
-        # Register with shortcut manager
+        # Auto-repeat coalescing (one dispatch per event-loop tick)
+        self._coalesce_keys: Set[int] = set()
+        self._pending_key: Optional[tuple] = None
+
+        # Set by the shortcut manager once shortcuts exist for our context
+        self._has_context_shortcuts = False
+
+        # Register with shortcut manager and keep a reference for the
+        # per-keystroke path instead of resolving the singleton each time
         manager = get_shortcut_manager()
+        self._shortcut_manager = manager
+        self._handle_key_event = manager.handle_key_event
         if isinstance(self, QWidget):
             manager.register_widget_context(self, context)
 
@@ -87,26 +127,62 @@ class KeyCaptureMixin:
             consume: If True, don't propagate the event
         """
         # Convert modifiers to int value for dict key (PyQt6 compatible)
-        mod_value = modifiers.value if hasattr(modifiers, 'value') else int(modifiers)
-        binding_key = (key, mod_value)
-        self._key_bindings[binding_key] = KeyBinding(
+        binding_key = (key, _mod_value(modifiers))
+        self._key_bindings[binding_key] = (callback, consume)
+        self._help_bindings[binding_key] = KeyBinding(
             key=key,
             modifiers=modifiers,
             callback=callback,
             description=description,
             consume=consume
         )
+        if key == _TAB or key == _BACKTAB:
+            self._update_tab_callbacks()
 
     def unbind_key(self, key: int, modifiers: Qt.KeyboardModifier = Qt.KeyboardModifier.NoModifier):
         """Remove a key binding"""
-        mod_value = modifiers.value if hasattr(modifiers, 'value') else int(modifiers)
-        binding_key = (key, mod_value)
+        binding_key = (key, _mod_value(modifiers))
         self._key_bindings.pop(binding_key, None)
+        self._help_bindings.pop(binding_key, None)
+        if key == _TAB or key == _BACKTAB:
+            self._update_tab_callbacks()
+
+    def _update_tab_callbacks(self):
+        """Refresh the cached Tab/Backtab callbacks after (un)binding"""
+        bindings_get = self._key_bindings.get
+        tab = bindings_get(_TAB_KEY)
+        backtab = bindings_get(_BACKTAB_KEY) or bindings_get(_BACKTAB_PLAIN)
+        self._tab_callback = tab[0] if tab else None
+        self._backtab_callback = backtab[0] if backtab else None
+
+    def enable_context_shortcuts(self, enabled: bool = True):
+        """Enable/disable consulting the shortcut manager on key presses"""
+        self._has_context_shortcuts = enabled
 
     def set_pass_through(self, keys: Set[int]):
         """Set keys that should be passed through to parent"""
         self._pass_through_keys = keys
 
+    def set_coalesce_keys(self, keys: Set[int]):
+        """
+        Set keys whose auto-repeat events are coalesced.
+
+        Repeats of a bound key arriving within one event-loop tick are
+        collapsed so the binding runs once per tick instead of per event.
+        """
+        self._coalesce_keys = keys
+
+    def _flush_key(self):
+        """Dispatch the last coalesced auto-repeat key"""
+        binding_key = self._pending_key
+        self._pending_key = None
+        binding = self._key_bindings.get(binding_key) if binding_key else None
+        if binding:
+            try:
+                binding[0]()
+            except Exception as e:
+                logger.error(f"Key binding error for {binding_key[0]}: {e}")
+
     def handle_key_press(self, event: QKeyEvent) -> bool:
         """
         Handle a key press event.
@@ -122,31 +198,42 @@ class KeyCaptureMixin:
         if key in self._pass_through_keys:
             return False
 
-        # First check global shortcut manager for context shortcuts
-        manager = get_shortcut_manager()
-        if manager.handle_key_event(event, self._key_context):
-            return True
+        # Coalesce auto-repeated keys: remember the latest and flush once
+        if key in self._coalesce_keys and event.isAutoRepeat():
+            binding_key = (key, modifiers.value)
+            binding = self._key_bindings.get(binding_key)
+            if binding:
+                if self._pending_key is None:
+                    QTimer.singleShot(0, self._flush_key)
+                self._pending_key = binding_key
+                return binding[1]
 
-        # Check local bindings
-        # Try with exact modifiers
-        mod_value = modifiers.value if hasattr(modifiers, 'value') else int(modifiers)
-        binding_key = (key, mod_value)
-        binding = self._key_bindings.get(binding_key)
+        # First check global shortcut manager for context shortcuts
+        # (skipped entirely while no shortcuts exist for this context).
+        # Terminal-like widgets check their own bindings first instead.
+        check_manager = self._also_check_global and self._has_context_shortcuts
+        if check_manager and not self._capture_all:
+            if self._handle_key_event(event, self._key_context):
+                return True
 
-        # If no exact match, try without modifiers for special keys
-        if not binding and mod_value == 0:
-            binding = self._key_bindings.get((key, 0))
+        # Check local bindings (exact key + modifiers)
+        binding = self._key_bindings.get((key, modifiers.value))
 
         if binding:
+            callback, consume = binding
             try:
-                binding.callback()
-                return binding.consume
+                callback()
+                return consume
             except Exception as e:
                 logger.error(f"Key binding error for {key}: {e}")
                 return False
 
         # If capture_all is set, consume all key events
-        return self._capture_all
+        if self._capture_all:
+            if check_manager:
+                self._handle_key_event(event, self._key_context)
+            return True
+        return False
 
     def handle_event(self, event: QEvent) -> Optional[bool]:
         """
@@ -157,29 +244,22 @@ class KeyCaptureMixin:
             True if handled, False if not handled, None to use default
         """
         if event.type() == QEvent.Type.KeyPress:
-            key_event = event
-            key = key_event.key()
+            key = event.key()
 
             # Tab key needs special handling to prevent focus change
-            if key == Qt.Key.Key_Tab:
-                binding = self._key_bindings.get((Qt.Key.Key_Tab, 0))
-                if binding:
+            if key == _TAB:
+                if self._tab_callback:
                     try:
-                        binding.callback()
+                        self._tab_callback()
                         return True
                     except Exception as e:
                         logger.error(f"Tab key error: {e}")
 
             # Backtab (Shift+Tab)
-            elif key == Qt.Key.Key_Backtab:
-                binding = self._key_bindings.get(
-                    (Qt.Key.Key_Backtab, int(Qt.KeyboardModifier.ShiftModifier))
-                )
-                if not binding:
-                    binding = self._key_bindings.get((Qt.Key.Key_Backtab, 0))
-                if binding:
+            elif key == _BACKTAB:
+                if self._backtab_callback:
                     try:
-                        binding.callback()
+                        self._backtab_callback()
                         return True
                     except Exception as e:
                         logger.error(f"Backtab key error: {e}")
@@ -189,20 +269,14 @@ class KeyCaptureMixin:
     def get_key_bindings_help(self) -> str:
         """Get help text for this widget's key bindings"""
         lines = []
-        for (key, mods), binding in self._key_bindings.items():
+        for (key, mods), binding in self._help_bindings.items():
             key_name = Qt.Key(key).name.replace("Key_", "")
             mod_str = ""
-            # Convert mods to int for bitwise operations
-            mods_int = mods.value if hasattr(mods, 'value') else mods
-            ctrl_val = Qt.KeyboardModifier.ControlModifier.value if hasattr(Qt.KeyboardModifier.ControlModifier, 'value') else int(Qt.KeyboardModifier.ControlModifier)
-            shift_val = Qt.KeyboardModifier.ShiftModifier.value if hasattr(Qt.KeyboardModifier.ShiftModifier, 'value') else int(Qt.KeyboardModifier.ShiftModifier)
-            alt_val = Qt.KeyboardModifier.AltModifier.value if hasattr(Qt.KeyboardModifier.AltModifier, 'value') else int(Qt.KeyboardModifier.AltModifier)
-
-            if mods_int & ctrl_val:
+            if mods & _CTRL:
                 mod_str += "Ctrl+"
-            if mods_int & shift_val:
+            if mods & _SHIFT:
                 mod_str += "Shift+"
-            if mods_int & alt_val:
+            if mods & _ALT:
                 mod_str += "Alt+"
             lines.append(f"{mod_str}{key_name}: {binding.description}")
         return "\n".join(lines)
@@ -220,14 +294,15 @@ class FocusAwareWidget(QWidget):
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
         # Register with shortcut manager
-        manager = get_shortcut_manager()
-        manager.register_widget_context(self, context)
+        self._shortcut_manager = get_shortcut_manager()
+        self._shortcut_manager.register_widget_context(self, context)
 
     def focusInEvent(self, event):
         """Update shortcut context when this widget gets focus"""
         super().focusInEvent(event)
-        manager = get_shortcut_manager()
-        manager.set_context(self._shortcut_context)
+        manager = self._shortcut_manager
+        if self._shortcut_context is not manager.current_context:
+            manager.set_context(self._shortcut_context)
 
     def focusOutEvent(self, event):
         """Reset shortcut context when this widget loses focus"""
@@ -7,6 +7,8 @@ Supports: Headers, Bold, Italic, Code blocks, Lists, Links
 """
 import re
 import logging
+import threading
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -17,10 +19,111 @@ except ImportError:
 
 logger = logging.getLogger("ailinux.markdown")
 
+_CODEBLOCK_RE = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
 
-# CSS Styles for Markdown elements
-MARKDOWN_CSS = '''
-<style>
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Text containing none of these (and no numbered list or indented code)
+# renders as plain text; "<" and "&" go through the parser, which decides
+# about raw HTML and entities, so nothing here needs escaping
+_MARKDOWN_SENTINELS = frozenset("*_#`[>~|-+=<&\\")
+_ORDERED_LIST_RE = re.compile(r'^\s*\d+[.)]\s', re.MULTILINE)
+_INDENTED_CODE_RE = re.compile(r'^(?: {0,3}\t| {4})', re.MULTILINE)
+# One or more blank (or whitespace-only) lines separate paragraphs
+_PARAGRAPH_BREAK_RE = re.compile(r'\n[ \t]*\n\s*')
+
+
+def _render_plain(text: str) -> str:
+    """Blank lines start a paragraph, single newlines become <br>"""
+    html = _PARAGRAPH_BREAK_RE.sub("</p><p>", text.strip()).replace("\n", "<br>")
+    return f'<p>{html}</p>'
+
+
+def _render_inline(line: str) -> str:
+    """Render **bold**, *italic* and `code` spans of a single line"""
+    # Same passes as the regex renderer: bold before italic, so a lone
+    # "*" never pairs with half of a "**"; unmatched markers stay literal
+    if "*" in line:
+        if "**" in line:
+            line = _BOLD_RE.sub(r'<strong>\1</strong>', line)
+        line = _ITALIC_RE.sub(r'<em>\1</em>', line)
+    if "`" in line:
+        line = _INLINE_CODE_RE.sub(r'<code>\1</code>', line)
+    return line
+
+
+def _is_fence(line: str) -> bool:
+    """Check for an opening code fence (```lang)"""
+    if not line.startswith("```"):
+        return False
+    lang = line[3:]
+    return not lang or lang.replace("_", "").isalnum()
+
+
+def _fallback_render(text: str) -> str:
+    """Basic Markdown rendering without library (single pass over lines)"""
+    lines = text.translate(_HTML_ESCAPE_TABLE).split("\n")
+    
+    # A fence only opens a block if a closing ``` follows later
+    last_fence = -1
+    for idx, line in enumerate(lines):
+        if "```" in line:
+            last_fence = idx
+    
+    parts = ["<p>"]
+    append = parts.append
+    newlines = 0
+    i = 0
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        if i:
+            newlines += 1
+        
+        # Code blocks
+        if i < last_fence and _is_fence(line):
+            j = i + 1
+            while "```" not in lines[j]:
+                j += 1
+            end = lines[j].index("```")
+            code = "\n".join(lines[i + 1:j] + [lines[j][:end]])
+            html = f"<pre><code>{code}</code></pre>{_render_inline(lines[j][end + 3:])}"
+            i = j + 1
+        else:
+            i += 1
+            if not line:
+                continue
+            # Headers
+            level = len(line) - len(line.lstrip("#"))
+            if 1 <= level <= 4 and line[level:level + 1] == " " and len(line) > level + 1:
+                html = f"<h{level}>{_render_inline(line[level + 1:])}</h{level}>"
+            # Lists
+            elif line.startswith("- ") and len(line) > 2:
+                html = f"<li>{_render_inline(line[2:])}</li>"
+            else:
+                html = _render_inline(line)
+        
+        # Line breaks: blank line -> paragraph, single newline -> <br>
+        if newlines:
+            append("</p><p>" * (newlines // 2))
+            if newlines % 2:
+                append("<br>")
+            newlines = 0
+        append(html)
+    
+    if newlines:
+        append("</p><p>" * (newlines // 2))
+        if newlines % 2:
+            append("<br>")
+    append("</p>")
+    return "".join(parts)
+
+
+# CSS Styles for Markdown elements (stylesheet body, without <style> tags)
+MARKDOWN_CSS_BODY = '''
     .md-content {
         font-family: 'Segoe UI', Arial, sans-serif;
         font-size: 13px;
@@ -126,86 +229,116 @@ MARKDOWN_CSS = '''
         background: #2a2a3e;
         font-weight: bold;
     }
-</style>
 '''
 
+MARKDOWN_CSS = f'''
+<style>{MARKDOWN_CSS_BODY}</style>
+'''
+
+
+_HTML_PREFIX = '<div class="md-content">'
+
+
+def install_markdown_stylesheet(text_edit) -> None:
+    """
+    Install the markdown CSS once as the document's default stylesheet.
+
+    render() only returns the HTML fragment, so any QTextEdit showing
+    rendered markdown must call this once after creation.
+    """
+    text_edit.document().setDefaultStyleSheet(MARKDOWN_CSS_BODY)
+
+
+# markdown.Markdown keeps parse state, so each thread gets its own parser
+_parser_local = threading.local()
+
+
+def _get_parser():
+    """Get this thread's markdown parser (None without markdown library)"""
+    if not HAS_MARKDOWN:
+        return None
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = markdown.Markdown(
+            extensions=[
+                'fenced_code',
+                'tables',
+                'nl2br',
+                'sane_lists',
+            ]
+        )
+        _parser_local.parser = parser
+    return parser
+
+
+class RenderResult(str):
+    """
+    Rendered HTML returned by MarkdownRenderer.render().
+
+    Behaves like a plain str and additionally carries the fenced code
+    blocks of the source text, so callers don't need to scan it again.
+    The blocks are a tuple because cached results are shared between callers.
+    """
+    code_blocks: tuple
+
+
+def _find_code_blocks(text: str) -> list:
+    """Collect fenced code blocks as {"lang", "code"} dicts"""
+    return [
+        {"lang": match.group(1) or "text", "code": match.group(2).strip()}
+        for match in _CODEBLOCK_RE.finditer(text)
+    ]
+
+
+def _convert(text: str) -> str:
+    """Convert Markdown to an HTML body"""
+    parser = _get_parser()
+    if parser is None:
+        return _fallback_render(text)
+    # Parsers start clean and are reset after use, never before
+    html = parser.convert(text)
+    parser.reset()
+    return html
+
+
+@lru_cache(maxsize=256)
+def _render(text: str) -> RenderResult:
+    """Render Markdown to a styled HTML fragment, cached by content"""
+    result = RenderResult(f'{_HTML_PREFIX}{_convert(text)}</div>')
+    result.code_blocks = tuple(_find_code_blocks(text))
+    return result
+
 
 class MarkdownRenderer:
     """Renders Markdown to styled HTML for Qt widgets."""
     
     def __init__(self):
-        self.md = None
-        if HAS_MARKDOWN:
-            self.md = markdown.Markdown(
-                extensions=[
-                    'fenced_code',
-                    'tables',
-                    'nl2br',
-                    'sane_lists',
-                ]
-            )
+        self.md = _get_parser()
     
-    def render(self, text: str) -> str:
-        """Convert Markdown text to styled HTML."""
+    def render(self, text: str) -> RenderResult:
+        """Convert Markdown text to styled HTML (with .code_blocks)."""
         if not text:
-            return ""
+            result = RenderResult("")
+            result.code_blocks = ()
+            return result
         
-        if self.md:
-            self.md.reset()
-            html = self.md.convert(text)
-        else:
-            html = self._fallback_render(text)
+        # Fast path: no markdown syntax, skip the parser entirely
+        if (_MARKDOWN_SENTINELS.isdisjoint(text)
+                and not _ORDERED_LIST_RE.search(text)
+                and not _INDENTED_CODE_RE.search(text)):
+            result = RenderResult(f'{_HTML_PREFIX}{_render_plain(text)}</div>')
+            result.code_blocks = ()
+            return result
         
-        return f'{MARKDOWN_CSS}<div class="md-content">{html}</div>'
+        return _render(text)
     
     def _fallback_render(self, text: str) -> str:
         """Basic Markdown rendering without library"""
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        
-        # Headers
-        text = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', text, flags=re.MULTILINE)
-        text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-        text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
-        
-        # Bold and Italic
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-        
-        # Code blocks
-        text = re.sub(
-            r'```(\w*)\n(.*?)```',
-            r'<pre><code>\2</code></pre>',
-            text,
-            flags=re.DOTALL
-        )
-        
-        # Inline code
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-        
-        # Lists
-        text = re.sub(r'^- (.+)$', r'<li>\1</li>', text, flags=re.MULTILINE)
-        
-        # Line breaks
-        text = text.replace('\n\n', '</p><p>')
-        text = text.replace('\n', '<br>')
-        
-        return f'<p>{text}</p>'
+        return _fallback_render(text)
     
     def extract_code_blocks(self, text: str) -> list:
         """Extract code blocks from markdown text."""
-        blocks = []
-        pattern = r'```(\w*)\n(.*?)```'
-        
-        for match in re.finditer(pattern, text, re.DOTALL):
-            blocks.append({
-                "lang": match.group(1) or "text",
-                "code": match.group(2).strip()
-            })
-        
-        return blocks
+        return _find_code_blocks(text)
 
 
 # Singleton instance
@@ -219,6 +352,6 @@ def get_renderer() -> MarkdownRenderer:
     return _renderer
 
 
-def render_markdown(text: str) -> str:
+def render_markdown(text: str) -> RenderResult:
     """Convenience function to render markdown"""
     return get_renderer().render(text)
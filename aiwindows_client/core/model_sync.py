@@ -7,15 +7,37 @@ Cached lokal für Offline-Nutzung.
 import json
 import logging
 import asyncio
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from collections import defaultdict
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger("ailinux.model_sync")
 
 
-@dataclass
+def _dumps(obj: Any) -> bytes:
+    """Serialisiere Cache kompakt (orjson wenn verfügbar)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialisiere Cache (orjson wenn verfügbar)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
     """Model-Informationen"""
     id: str
@@ -23,6 +45,13 @@ class ModelInfo:
     provider: str
     category: str  # local, free_cloud, premium
     free: bool = True
+    # Vorberechnet für search_models()
+    id_lower: str = field(init=False, repr=False, compare=False)
+    name_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "id_lower", self.id.lower())
+        object.__setattr__(self, "name_lower", self.name.lower())
     
     def __hash__(self):
         return hash(self.id)
@@ -49,14 +78,31 @@ class ModelSyncManager:
         self.cache_file = self.config_dir / self.CACHE_FILE
         self.api_client = api_client
         self._cache: Optional[ModelCache] = None
+        self._by_id: Dict[str, ModelInfo] = {}
+        self._by_category: Dict[str, Tuple[ModelInfo, ...]] = {}
+        self._by_provider: Dict[str, Tuple[ModelInfo, ...]] = {}
+        self._free_models: Tuple[ModelInfo, ...] = ()
+        self._premium_models: Tuple[ModelInfo, ...] = ()
+        self._providers: Tuple[str, ...] = ()
+        self._model_ids: Tuple[str, ...] = ()
+        self._model_id_set: frozenset = frozenset()
+        # Persistent event loop for sync_blocking (started on first use)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._last_sync_dt: Optional[datetime] = None
+        # Rohdaten der Modelle wie vom Server/Cache geliefert (für _save_cache)
+        self._raw_models: Optional[List[Dict[str, Any]]] = None
         self._load_cache()
     
     def _load_cache(self):
         """Lade Cache von Disk"""
         if self.cache_file.exists():
             try:
-                data = json.loads(self.cache_file.read_text())
-                models = [ModelInfo(**m) for m in data.get("models", [])]
+                data = _loads(self.cache_file.read_bytes())
+                raw_models = data.get("models", [])
+                models = [ModelInfo(**m) for m in raw_models]
+                self._raw_models = raw_models
                 self._cache = ModelCache(
                     tier=data.get("tier", "guest"),
                     models=models,
@@ -70,33 +116,68 @@ class ModelSyncManager:
                 self._cache = ModelCache()
         else:
             self._cache = ModelCache()
+        self._rebuild_indexes()
+        self._last_sync_dt = self._parse_sync_timestamp()
+    
+    def _rebuild_indexes(self):
+        """Baue Lookup-Indizes nach Cache-Änderung neu auf"""
+        models = self._cache.models if self._cache else []
+        by_category: Dict[str, List[ModelInfo]] = defaultdict(list)
+        by_provider: Dict[str, List[ModelInfo]] = defaultdict(list)
+        free: List[ModelInfo] = []
+        premium: List[ModelInfo] = []
+        for m in models:
+            by_category[m.category].append(m)
+            by_provider[m.provider].append(m)
+            (free if m.free else premium).append(m)
+        # Tupel: die Getter geben die Indizes direkt heraus, Aufrufer
+        # dürfen sie nicht verändern können
+        self._by_id = {m.id: m for m in models}
+        self._by_category = {k: tuple(v) for k, v in by_category.items()}
+        self._by_provider = {k: tuple(v) for k, v in by_provider.items()}
+        self._free_models = tuple(free)
+        self._premium_models = tuple(premium)
+        self._providers = tuple(sorted(by_provider))
+        self._model_ids = tuple(m.id for m in models)
+        self._model_id_set = frozenset(self._model_ids)
     
     def _save_cache(self):
         """Speichere Cache auf Disk"""
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        data = {
-            "tier": self._cache.tier,
-            "models": [
-                {"id": m.id, "name": m.name, "provider": m.provider, 
+        raw_models = self._raw_models
+        if raw_models is None:
+            raw_models = [
+                {"id": m.id, "name": m.name, "provider": m.provider,
                  "category": m.category, "free": m.free}
                 for m in self._cache.models
-            ],
+            ]
+        data = {
+            "tier": self._cache.tier,
+            "models": raw_models,
             "categories": self._cache.categories,
             "sync_timestamp": self._cache.sync_timestamp,
             "version": self._cache.version
         }
-        self.cache_file.write_text(json.dumps(data, indent=2))
+        self.cache_file.write_bytes(_dumps(data))
         logger.info(f"Saved {len(self._cache.models)} models to cache")
     
-    def _needs_sync(self) -> bool:
-        """Prüfe ob Sync nötig ist"""
-        if not self._cache.sync_timestamp:
-            return True
+    def _parse_sync_timestamp(self) -> Optional[datetime]:
+        """Parse sync_timestamp einmalig (lokale, naive Zeit)"""
+        if not self._cache or not self._cache.sync_timestamp:
+            return None
         try:
             last_sync = datetime.fromisoformat(self._cache.sync_timestamp)
-            return datetime.now() - last_sync > self.CACHE_DURATION
-        except:
+        except (TypeError, ValueError):
+            return None
+        if last_sync.tzinfo is not None:
+            last_sync = last_sync.astimezone().replace(tzinfo=None)
+        return last_sync
+    
+    def _needs_sync(self) -> bool:
+        """Prüfe ob Sync nötig ist"""
+        if self._last_sync_dt is None:
             return True
+        return datetime.now() - self._last_sync_dt > self.CACHE_DURATION
     
     async def sync(self, force: bool = False) -> bool:
         """
@@ -120,7 +201,9 @@ class ModelSyncManager:
             response = await self.api_client.get("/client/models/sync")
             
             if response and "models" in response:
-                models = [ModelInfo(**m) for m in response["models"]]
+                raw_models = response["models"]
+                models = [ModelInfo(**m) for m in raw_models]
+                self._raw_models = raw_models
                 self._cache = ModelCache(
                     tier=response.get("tier", "guest"),
                     models=models,
@@ -128,6 +211,8 @@ class ModelSyncManager:
                     sync_timestamp=response.get("sync_timestamp", datetime.now().isoformat()),
                     version=response.get("version", "2.1")
                 )
+                self._rebuild_indexes()
+                self._last_sync_dt = self._parse_sync_timestamp()
                 self._save_cache()
                 logger.info(f"Synced {len(models)} models from server")
                 return True
@@ -139,17 +224,25 @@ class ModelSyncManager:
             logger.error(f"Sync failed: {e}")
             return False
     
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Starte den Hintergrund-Eventloop beim ersten Aufruf"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="ModelSyncLoop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+    
     def sync_blocking(self, force: bool = False) -> bool:
         """Blocking-Version von sync()"""
-        try:
-            return asyncio.get_event_loop().run_until_complete(self.sync(force))
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.sync(force))
-            finally:
-                loop.close()
+        if not force and not self._needs_sync():
+            return True
+        future = asyncio.run_coroutine_threadsafe(self.sync(force), self._ensure_loop())
+        return future.result()
     
     @property
     def models(self) -> List[ModelInfo]:
@@ -171,41 +264,42 @@ class ModelSyncManager:
         """Modelle pro Kategorie"""
         return self._cache.categories if self._cache else {}
     
-    def get_models_by_category(self, category: str) -> List[ModelInfo]:
+    def get_models_by_category(self, category: str) -> Tuple[ModelInfo, ...]:
         """Modelle einer Kategorie"""
-        return [m for m in self.models if m.category == category]
+        return self._by_category.get(category, ())
     
-    def get_models_by_provider(self, provider: str) -> List[ModelInfo]:
+    def get_models_by_provider(self, provider: str) -> Tuple[ModelInfo, ...]:
         """Modelle eines Providers"""
-        return [m for m in self.models if m.provider == provider]
+        return self._by_provider.get(provider, ())
     
-    def get_free_models(self) -> List[ModelInfo]:
+    def get_free_models(self) -> Tuple[ModelInfo, ...]:
         """Alle kostenlosen Modelle"""
-        return [m for m in self.models if m.free]
+        return self._free_models
     
-    def get_premium_models(self) -> List[ModelInfo]:
+    def get_premium_models(self) -> Tuple[ModelInfo, ...]:
         """Alle Premium-Modelle"""
-        return [m for m in self.models if not m.free]
+        return self._premium_models
     
     def search_models(self, query: str) -> List[ModelInfo]:
         """Suche Modelle nach Name/ID"""
         q = query.lower()
-        return [m for m in self.models if q in m.id.lower() or q in m.name.lower()]
+        return [m for m in self.models if q in m.id_lower or q in m.name_lower]
     
     def get_model(self, model_id: str) -> Optional[ModelInfo]:
         """Hole spezifisches Modell"""
-        for m in self.models:
-            if m.id == model_id:
-                return m
-        return None
+        return self._by_id.get(model_id)
+    
+    def has_model(self, model_id: str) -> bool:
+        """Prüfe ob eine Model-ID bekannt ist"""
+        return model_id in self._model_id_set
     
-    def get_providers(self) -> List[str]:
+    def get_providers(self) -> Tuple[str, ...]:
         """Liste aller Provider"""
-        return sorted(set(m.provider for m in self.models))
+        return self._providers
     
-    def get_model_ids(self) -> List[str]:
+    def get_model_ids(self) -> Tuple[str, ...]:
         """Liste aller Model-IDs (für Autocomplete)"""
-        return [m.id for m in self.models]
+        return self._model_ids
 
 
 # Singleton
@@ -8,18 +8,54 @@ Centralized keyboard shortcut management with:
 - Conflict detection
 - Dynamic registration/unregistration
 """
+import bisect
 import logging
-from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Set
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum, auto
 
-from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut
 from PyQt6.QtWidgets import QWidget, QApplication
 
 logger = logging.getLogger("ailinux.shortcut_manager")
 
 
+@lru_cache(maxsize=512)
+def _normalize_key_sequence(key_sequence: str) -> str:
+    """Normalize a key sequence string via Qt (memoized, inputs are few)"""
+    return QKeySequence(key_sequence).toString()
+
+
+# Modifiers that take part in shortcut matching
+_MOD_MASK = (
+    Qt.KeyboardModifier.ControlModifier
+    | Qt.KeyboardModifier.ShiftModifier
+    | Qt.KeyboardModifier.AltModifier
+    | Qt.KeyboardModifier.MetaModifier
+).value
+
+
+@lru_cache(maxsize=512)
+def _key_combo(key_sequence: str) -> Optional[Tuple[int, int]]:
+    """Split a single-chord key sequence into (modifiers, key) ints"""
+    ks = QKeySequence(key_sequence)
+    if ks.count() != 1:
+        return None
+    combo = ks[0]
+    return (combo.keyboardModifiers().value & _MOD_MASK, combo.key().value)
+
+
+# Upper bound on idle QShortcuts kept for reuse
+_SHORTCUT_POOL_SIZE = 64
+
+# Dynamic Qt property holding a widget's ShortcutContext value
+_CONTEXT_PROPERTY = "shortcut_context"
+
+
 class ShortcutContext(Enum):
     """Context in which a shortcut is active"""
     GLOBAL = auto()          # Always active
@@ -30,17 +66,26 @@ class ShortcutContext(Enum):
     EDITOR = auto()          # Only when editor is focused
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShortcutInfo:
-    """Information about a registered shortcut"""
+    """Information about a registered shortcut (enabled state lives in the manager)"""
     key_sequence: str
     callback: Callable
     context: ShortcutContext
     description: str = ""
-    enabled: bool = True
     category: str = "General"
 
 
+def _sort_key(info: ShortcutInfo) -> str:
+    """Order shortcuts within a category for the help listing"""
+    return info.key_sequence
+
+
+def _context_suffix(info: ShortcutInfo) -> str:
+    """Context note shown after non-global shortcuts in the help listing"""
+    return f" ({info.context.name})" if info.context != ShortcutContext.GLOBAL else ""
+
+
 class ShortcutManager(QObject):
     """
     Centralized shortcut manager for the application.
@@ -66,17 +111,51 @@ class ShortcutManager(QObject):
         # Registered shortcuts: key_sequence -> ShortcutInfo
         self._shortcuts: Dict[str, ShortcutInfo] = {}
 
+        # key_sequence -> enabled flag (ShortcutInfo is frozen)
+        self._enabled: Dict[str, bool] = {}
+
         # Qt QShortcut objects for global shortcuts
         self._qt_shortcuts: Dict[str, QShortcut] = {}
 
+        # id(QShortcut) -> key_sequence, resolved in _on_qt_shortcut
+        self._qt_shortcut_keys: Dict[int, str] = {}
+
+        # Disabled QShortcuts kept for reuse by _create_qt_shortcut
+        self._shortcut_pool: List[QShortcut] = []
+
         # Current active context
         self._current_context: ShortcutContext = ShortcutContext.GLOBAL
 
-        # Widget to context mapping
-        self._widget_contexts: Dict[int, ShortcutContext] = {}
+        # context_changed is coalesced to one emission per event-loop tick
+        self._emitted_context: ShortcutContext = ShortcutContext.GLOBAL
+        self._ctx_timer_armed = False
+
+        # Key-capture widgets to notify when shortcuts for their context
+        # appear or disappear (see KeyCaptureMixin.enable_context_shortcuts)
+        self._context_widgets: Dict[ShortcutContext, "weakref.WeakSet"] = {}
 
         # Blocked shortcuts (temporarily disabled)
         self._blocked: Set[str] = set()
+        self._block_all_flag = False
+
+        # (modifiers, key) -> ShortcutInfo, rebuilt on (un)register
+        self._event_index: Dict[Tuple[int, int], ShortcutInfo] = {}
+
+        # context -> shortcuts, maintained on (un)register
+        self._by_context: Dict[ShortcutContext, List[ShortcutInfo]] = {
+            c: [] for c in ShortcutContext
+        }
+
+        # category -> shortcuts kept sorted by key_sequence (bisect.insort)
+        self._category_buckets: Dict[str, List[ShortcutInfo]] = {}
+
+        # Lazily built help/query results, reset by _invalidate_caches()
+        self._sorted_categories: Optional[List[Tuple[str, List[ShortcutInfo]]]] = None
+        self._html_cache: Optional[str] = None
+
+        # Guards mutation of the registries; key dispatch stays lock-free
+        # by reading the _event_index reference, which is swapped whole
+        self._lock = threading.RLock()
 
     def register(
         self,
@@ -104,82 +183,167 @@ class ShortcutManager(QObject):
         # Normalize key sequence
         key_sequence = self._normalize_key(key_sequence)
 
-        # Check for conflicts
-        if key_sequence in self._shortcuts and not replace:
-            existing = self._shortcuts[key_sequence]
-            if existing.context == context:
-                logger.warning(
-                    f"Shortcut conflict: {key_sequence} already registered "
-                    f"for context {context.name}"
-                )
-                return False
-
-        # Create shortcut info
-        info = ShortcutInfo(
-            key_sequence=key_sequence,
-            callback=callback,
-            context=context,
-            description=description,
-            category=category
-        )
-
-        self._shortcuts[key_sequence] = info
-
-        # For global shortcuts, create QShortcut
-        if context == ShortcutContext.GLOBAL and self.parent_widget:
-            self._create_qt_shortcut(key_sequence, callback)
-
-        logger.debug(f"Registered shortcut: {key_sequence} ({context.name})")
-        return True
+        with self._lock:
+            # Check for conflicts
+            if key_sequence in self._shortcuts and not replace:
+                existing = self._shortcuts[key_sequence]
+                if existing.context == context:
+                    logger.warning(
+                        f"Shortcut conflict: {key_sequence} already registered "
+                        f"for context {context.name}"
+                    )
+                    return False
+
+            # Create shortcut info
+            info = ShortcutInfo(
+                key_sequence=key_sequence,
+                callback=callback,
+                context=context,
+                description=description,
+                category=category
+            )
+
+            previous = self._shortcuts.get(key_sequence)
+            if previous is not None:
+                self._remove_from_buckets(previous)
+                if previous.context is not context:
+                    self._notify_context_widgets(previous.context)
+            self._shortcuts[key_sequence] = info
+            self._enabled[key_sequence] = True
+            self._by_context[context].append(info)
+            bisect.insort(
+                self._category_buckets.setdefault(category, []),
+                info,
+                key=_sort_key,
+            )
+            self._rebuild_event_index()
+            self._invalidate_caches()
+
+            # For global shortcuts, create QShortcut
+            if context == ShortcutContext.GLOBAL and self.parent_widget:
+                self._create_qt_shortcut(key_sequence, callback)
+            else:
+                self._notify_context_widgets(context)
+
+            logger.debug(f"Registered shortcut: {key_sequence} ({context.name})")
+            return True
 
     def unregister(self, key_sequence: str) -> bool:
         """Unregister a shortcut"""
-        key_sequence = self._normalize_key(key_sequence)
-
-        if key_sequence in self._shortcuts:
-            del self._shortcuts[key_sequence]
-
-            # Remove Qt shortcut if exists
-            if key_sequence in self._qt_shortcuts:
-                self._qt_shortcuts[key_sequence].deleteLater()
-                del self._qt_shortcuts[key_sequence]
-
-            logger.debug(f"Unregistered shortcut: {key_sequence}")
-            return True
+        key_sequence = self._resolve_key(key_sequence)
+
+        with self._lock:
+            if key_sequence in self._shortcuts:
+                info = self._shortcuts.pop(key_sequence)
+                self._enabled.pop(key_sequence, None)
+                self._remove_from_buckets(info)
+                self._rebuild_event_index()
+                self._invalidate_caches()
+                self._notify_context_widgets(info.context)
+
+                # Remove Qt shortcut if exists
+                if key_sequence in self._qt_shortcuts:
+                    self._release_qt_shortcut(self._qt_shortcuts.pop(key_sequence))
+
+                logger.debug(f"Unregistered shortcut: {key_sequence}")
+                return True
         return False
 
     def _normalize_key(self, key_sequence: str) -> str:
         """Normalize key sequence for consistent comparison"""
         # Use Qt's normalization
-        ks = QKeySequence(key_sequence)
-        return ks.toString()
+        return _normalize_key_sequence(key_sequence)
+
+    def _resolve_key(self, key_sequence: str) -> str:
+        """Normalize a key, trusting ones already registered as-is"""
+        if key_sequence in self._shortcuts:
+            return key_sequence
+        return _normalize_key_sequence(key_sequence)
+
+    def _rebuild_event_index(self):
+        """Rebuild the (modifiers, key) lookup used by handle_key_event"""
+        index: Dict[Tuple[int, int], ShortcutInfo] = {}
+        for key_sequence, info in self._shortcuts.items():
+            combo = _key_combo(key_sequence)
+            if combo is not None:
+                index[combo] = info
+        self._event_index = index
+
+    def _remove_from_buckets(self, info: ShortcutInfo):
+        """Drop a shortcut from its context and sorted category buckets"""
+        self._by_context[info.context].remove(info)
+
+        bucket = self._category_buckets.get(info.category)
+        if not bucket:
+            return
+        i = bisect.bisect_left(bucket, info.key_sequence, key=_sort_key)
+        if i < len(bucket) and bucket[i] is info:
+            del bucket[i]
+        if not bucket:
+            del self._category_buckets[info.category]
+
+    def _invalidate_caches(self):
+        """Drop cached category/HTML views after a change"""
+        self._sorted_categories = None
+        self._html_cache = None
 
     def _create_qt_shortcut(self, key_sequence: str, callback: Callable):
         """Create a Qt QShortcut for global shortcuts"""
         if not self.parent_widget:
             return
 
-        # Remove existing if any
+        # Rebinding an existing key keeps its QShortcut as-is
         if key_sequence in self._qt_shortcuts:
-            self._qt_shortcuts[key_sequence].deleteLater()
+            return
 
-        shortcut = QShortcut(QKeySequence(key_sequence), self.parent_widget)
-        shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        shortcut.activated.connect(lambda: self._on_shortcut_activated(key_sequence))
+        shortcut = self._acquire_qt_shortcut()
+        shortcut.setKey(QKeySequence(key_sequence))
+        shortcut.setEnabled(True)
         self._qt_shortcuts[key_sequence] = shortcut
+        self._qt_shortcut_keys[id(shortcut)] = key_sequence
+
+    def _acquire_qt_shortcut(self) -> QShortcut:
+        """Reuse a pooled QShortcut or allocate a new one"""
+        while self._shortcut_pool:
+            shortcut = self._shortcut_pool.pop()
+            if shortcut.parent() is self.parent_widget:
+                return shortcut
+            shortcut.deleteLater()
+
+        shortcut = QShortcut(self.parent_widget)
+        shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+        shortcut.activated.connect(self._on_qt_shortcut)
+        return shortcut
+
+    def _release_qt_shortcut(self, shortcut: QShortcut):
+        """Disable a QShortcut and park it in the pool for reuse"""
+        self._qt_shortcut_keys.pop(id(shortcut), None)
+        if len(self._shortcut_pool) >= _SHORTCUT_POOL_SIZE:
+            shortcut.deleteLater()
+            return
+        shortcut.setEnabled(False)
+        shortcut.setKey(QKeySequence())
+        self._shortcut_pool.append(shortcut)
+
+    def _on_qt_shortcut(self):
+        """Shared slot for all QShortcuts - resolve the sender's key"""
+        key_sequence = self._qt_shortcut_keys.get(id(self.sender()))
+        if key_sequence is not None:
+            self._on_shortcut_activated(key_sequence)
 
     def _on_shortcut_activated(self, key_sequence: str):
         """Handle shortcut activation"""
-        if key_sequence in self._blocked:
+        if self._block_all_flag or key_sequence in self._blocked:
             return
 
         info = self._shortcuts.get(key_sequence)
-        if info and info.enabled:
+        if info and self._enabled.get(key_sequence, True):
             # Check context
             if info.context == ShortcutContext.GLOBAL or info.context == self._current_context:
                 try:
                     info.callback()
-                    self.shortcut_triggered.emit(key_sequence, info.description)
+                    if self.receivers(self.shortcut_triggered):
+                        self.shortcut_triggered.emit(key_sequence, info.description)
                 except Exception as e:
                     logger.error(f"Shortcut callback error: {e}")
 
@@ -195,37 +359,19 @@ class ShortcutManager(QObject):
         Returns:
             True if the event was handled by a shortcut
         """
-        # Build key sequence from event
-        key = event.key()
-        modifiers = event.modifiers()
-
-        # Skip pure modifier keys
-        if key in (Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Meta):
+        if self._block_all_flag:
             return False
 
-        # Build sequence
-        sequence_parts = []
-        if modifiers & Qt.KeyboardModifier.ControlModifier:
-            sequence_parts.append("Ctrl")
-        if modifiers & Qt.KeyboardModifier.ShiftModifier:
-            sequence_parts.append("Shift")
-        if modifiers & Qt.KeyboardModifier.AltModifier:
-            sequence_parts.append("Alt")
-        if modifiers & Qt.KeyboardModifier.MetaModifier:
-            sequence_parts.append("Meta")
-
-        # Add key name
-        key_seq = QKeySequence(key)
-        key_name = key_seq.toString()
-        if key_name:
-            sequence_parts.append(key_name)
-
-        key_sequence = "+".join(sequence_parts)
-        key_sequence = self._normalize_key(key_sequence)
+        # Look up (modifiers, key) directly - no key sequence string building
+        info = self._event_index.get(
+            (event.modifiers().value & _MOD_MASK, event.key())
+        )
+        if info is None:
+            return False
+        key_sequence = info.key_sequence
 
-        # Check if we have a shortcut for this
-        info = self._shortcuts.get(key_sequence)
-        if info and info.enabled and key_sequence not in self._blocked:
+        # Check if the shortcut is usable
+        if self._enabled.get(key_sequence, True) and key_sequence not in self._blocked:
             # Check context match
             if info.context == ShortcutContext.GLOBAL:
                 # Global shortcuts are handled by QShortcut, skip here
@@ -233,83 +379,143 @@ class ShortcutManager(QObject):
             elif widget_context and info.context == widget_context:
                 try:
                     info.callback()
-                    self.shortcut_triggered.emit(key_sequence, info.description)
+                    if self.receivers(self.shortcut_triggered):
+                        self.shortcut_triggered.emit(key_sequence, info.description)
                     return True
                 except Exception as e:
                     logger.error(f"Shortcut callback error: {e}")
 
         return False
 
+    @property
+    def current_context(self) -> ShortcutContext:
+        """Currently active context"""
+        return self._current_context
+
     def set_context(self, context: ShortcutContext):
-        """Set current active context"""
-        if context != self._current_context:
+        """Set current active context (context_changed fires once per tick)"""
+        with self._lock:
+            if context is self._current_context:
+                return
             self._current_context = context
-            self.context_changed.emit(context)
+            if self._ctx_timer_armed:
+                return
+            self._ctx_timer_armed = True
+        QTimer.singleShot(0, self._flush_context)
+
+    def _flush_context(self):
+        """Emit context_changed for the last context set during this tick"""
+        with self._lock:
+            self._ctx_timer_armed = False
+            context = self._current_context
+            if context is self._emitted_context:
+                return
+            self._emitted_context = context
+        self.context_changed.emit(context)
 
     def register_widget_context(self, widget: QWidget, context: ShortcutContext):
         """Register a widget's context for automatic context switching"""
-        self._widget_contexts[id(widget)] = context
+        with self._lock:
+            # Stored on the widget itself, so it is freed with the widget
+            widget.setProperty(_CONTEXT_PROPERTY, context.value)
+            if hasattr(widget, "enable_context_shortcuts"):
+                self._context_widgets.setdefault(context, weakref.WeakSet()).add(widget)
+                widget.enable_context_shortcuts(self._has_context_shortcuts(context))
+
+    def _has_context_shortcuts(self, context: ShortcutContext) -> bool:
+        """Check if any shortcut is registered for a context"""
+        return bool(self._by_context[context])
+
+    def _notify_context_widgets(self, context: ShortcutContext):
+        """Tell key-capture widgets whether their context has shortcuts"""
+        widgets = self._context_widgets.get(context)
+        if not widgets:
+            return
+        enabled = self._has_context_shortcuts(context)
+        for widget in list(widgets):
+            widget.enable_context_shortcuts(enabled)
 
     def get_widget_context(self, widget: QWidget) -> Optional[ShortcutContext]:
         """Get the context for a widget"""
-        return self._widget_contexts.get(id(widget))
+        try:
+            value = widget.property(_CONTEXT_PROPERTY)
+        except (AttributeError, RuntimeError):
+            # Not a QObject, or its C++ side is already gone
+            return None
+        return ShortcutContext(value) if value is not None else None
 
     def block_shortcut(self, key_sequence: str):
         """Temporarily block a shortcut"""
-        self._blocked.add(self._normalize_key(key_sequence))
+        with self._lock:
+            self._blocked.add(self._resolve_key(key_sequence))
 
     def unblock_shortcut(self, key_sequence: str):
         """Unblock a shortcut"""
-        self._blocked.discard(self._normalize_key(key_sequence))
+        with self._lock:
+            self._blocked.discard(self._resolve_key(key_sequence))
 
     def block_all(self):
         """Block all shortcuts (e.g., for modal dialogs)"""
-        self._blocked = set(self._shortcuts.keys())
+        with self._lock:
+            self._block_all_flag = True
 
     def unblock_all(self):
         """Unblock all shortcuts"""
-        self._blocked.clear()
+        with self._lock:
+            self._block_all_flag = False
+            self._blocked.clear()
 
     def enable_shortcut(self, key_sequence: str, enabled: bool = True):
         """Enable or disable a shortcut"""
-        key_sequence = self._normalize_key(key_sequence)
-        if key_sequence in self._shortcuts:
-            self._shortcuts[key_sequence].enabled = enabled
+        key_sequence = self._resolve_key(key_sequence)
+        with self._lock:
+            if key_sequence in self._shortcuts:
+                self._enabled[key_sequence] = enabled
+                self._invalidate_caches()
+
+    def is_shortcut_enabled(self, key_sequence: str) -> bool:
+        """Check whether a registered shortcut is enabled"""
+        return self._enabled.get(self._resolve_key(key_sequence), False)
 
     def get_shortcuts_by_category(self) -> Dict[str, List[ShortcutInfo]]:
-        """Get all shortcuts grouped by category"""
-        result: Dict[str, List[ShortcutInfo]] = {}
-        for info in self._shortcuts.values():
-            if info.category not in result:
-                result[info.category] = []
-            result[info.category].append(info)
-        return result
+        """Get all shortcuts grouped by category (a copy, safe to modify)"""
+        with self._lock:
+            return {
+                category: list(bucket)
+                for category, bucket in self._category_buckets.items()
+            }
 
     def get_shortcuts_by_context(self, context: ShortcutContext) -> List[ShortcutInfo]:
-        """Get all shortcuts for a specific context"""
-        return [info for info in self._shortcuts.values() if info.context == context]
+        """Get all shortcuts for a specific context (a copy, safe to modify)"""
+        with self._lock:
+            return list(self._by_context[context])
 
     def get_all_shortcuts(self) -> List[ShortcutInfo]:
         """Get all registered shortcuts"""
-        return list(self._shortcuts.values())
+        with self._lock:
+            return list(self._shortcuts.values())
 
     def get_shortcuts_html(self) -> str:
         """Generate HTML help for all shortcuts"""
-        categories = self.get_shortcuts_by_category()
-        html = []
-
-        for category, shortcuts in sorted(categories.items()):
-            html.append(f"<h3>{category}</h3>")
-            html.append("<table>")
-            for info in sorted(shortcuts, key=lambda x: x.key_sequence):
-                context_str = f" ({info.context.name})" if info.context != ShortcutContext.GLOBAL else ""
-                html.append(
-                    f"<tr><td><b>{info.key_sequence}</b></td>"
-                    f"<td>{info.description}{context_str}</td></tr>"
-                )
-            html.append("</table>")
-
-        return "\n".join(html)
+        if self._html_cache is not None:
+            return self._html_cache
+
+        with self._lock:
+            if self._sorted_categories is None:
+                self._sorted_categories = sorted(self.get_shortcuts_by_category().items())
+            sorted_categories = self._sorted_categories
+
+        self._html_cache = "\n".join(
+            f"<h3>{category}</h3>\n<table>\n"
+            + "\n".join(
+                f"<tr><td><b>{info.key_sequence}</b></td>"
+                f"<td>{info.description}{_context_suffix(info)}</td></tr>"
+                for info in shortcuts
+            )
+            + "\n</table>"
+            for category, shortcuts in sorted_categories
+        )
+        return self._html_cache
 
 
 # Singleton instance
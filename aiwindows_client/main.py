@@ -15,6 +15,7 @@ import argparse
 import signal
 import atexit
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent to path for imports
@@ -85,16 +86,6 @@ def setup_hardware_acceleration():
         logger.warning(f"Hardware detection failed, using defaults: {e}")
         return {}
 
-# Run hardware setup BEFORE importing Qt
-_hw_hints = setup_hardware_acceleration()
-
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QSurfaceFormat
-
-# IMPORTANT: Import WebEngine BEFORE QApplication is created
-from PyQt6.QtWebEngineWidgets import QWebEngineView  # noqa: F401
-
 
 def parse_args():
     """Parse command line arguments"""
@@ -151,8 +142,8 @@ def parse_args():
 def manage_autostart(enable: bool) -> bool:
     """Enable or disable systemd autostart service."""
     import subprocess
+    action = "enable" if enable else "disable"
     try:
-        action = "enable" if enable else "disable"
         result = subprocess.run(
             ["systemctl", "--user", action, "ailinux-client"],
             capture_output=True,
@@ -162,14 +153,19 @@ def manage_autostart(enable: bool) -> bool:
     except Exception as e:
         logger.error(f"Failed to {action} autostart: {e}")
         return False
+    finally:
+        # Unit state changed (or may have) - drop the memoized answer
+        is_autostart_enabled.cache_clear()
 
 
+@lru_cache(maxsize=1)
 def is_autostart_enabled() -> bool:
-    """Check if autostart is enabled."""
+    """Check if autostart is enabled (memoized until manage_autostart runs)."""
     import subprocess
     try:
         result = subprocess.run(
-            ["systemctl", "--user", "is-enabled", "ailinux-client"],
+            ["systemctl", "--user", "show", "-p", "UnitFileState", "--value",
+             "ailinux-client"],
             capture_output=True,
             text=True
         )
@@ -178,6 +174,19 @@ def is_autostart_enabled() -> bool:
         return False
 
 
+THEMES_DIR = Path(__file__).parent / "assets" / "themes"
+
+
+def load_stylesheet(name: str) -> str:
+    """Load a QSS theme from assets/themes/<name>.qss."""
+    path = THEMES_DIR / f"{name}.qss"
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not load stylesheet {path}: {e}")
+        return ""
+
+
 def main():
     """Main entry point"""
     args = parse_args()
@@ -220,6 +229,17 @@ def main():
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Run hardware setup BEFORE importing Qt - only the GUI path needs it,
+    # so --hwinfo and the autostart commands exit without loading Qt
+    hw_hints = setup_hardware_acceleration()
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QSurfaceFormat
+
+    # IMPORTANT: Import WebEngine BEFORE QApplication is created
+    from PyQt6.QtWebEngineWidgets import QWebEngineView  # noqa: F401
+
     logger.info(f"Starting AILinux Client (desktop_mode={args.desktop})")
     logger.info(f"Server: https://api.ailinux.me")
 
@@ -229,7 +249,7 @@ def main():
     surface_format.setSwapInterval(1)  # V-Sync
 
     # Enable antialiasing if GPU is available
-    if _hw_hints.get('antialiasing', False) and not args.software_render:
+    if hw_hints.get('antialiasing', False) and not args.software_render:
         surface_format.setSamples(4)  # 4x MSAA
     else:
         surface_format.setSamples(0)
@@ -241,49 +261,15 @@ def main():
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
-    # Create Qt application
-    app = QApplication(sys.argv)
+    # Create Qt application - our flags were consumed by argparse (which
+    # rejects unknown ones), so Qt only needs the program name
+    app = QApplication(sys.argv[:1])
     app.setApplicationName("AILinux Client")
     app.setOrganizationName("AILinux")
     app.setOrganizationDomain("ailinux.me")
 
     # Dark theme
-    app.setStyleSheet("""
-        QWidget {
-            background-color: #1a1a1a;
-            color: #e0e0e0;
-        }
-        QLineEdit, QTextEdit, QPlainTextEdit {
-            background-color: #252525;
-            border: 1px solid #333;
-            border-radius: 4px;
-            padding: 4px;
-        }
-        QPushButton {
-            background-color: #3b82f6;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 6px 16px;
-        }
-        QPushButton:hover {
-            background-color: #2563eb;
-        }
-        QPushButton:pressed {
-            background-color: #1d4ed8;
-        }
-        QScrollBar:vertical {
-            background: #252525;
-            width: 10px;
-        }
-        QScrollBar::handle:vertical {
-            background: #444;
-            border-radius: 5px;
-        }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-    """)
+    app.setStyleSheet(load_stylesheet("dark"))
 
     # Initialize API client
     from .core.api_client import APIClient
@@ -11,20 +11,448 @@ Tier-based access:
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
     QLineEdit, QPushButton, QComboBox, QLabel, QScrollArea,
-    QListWidget, QListWidgetItem, QFrame, QApplication,
+    QListWidget, QListWidgetItem, QListView, QFrame, QApplication,
     QStyledItemDelegate, QStyle, QPlainTextEdit, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QEvent, QSettings
-from PyQt6.QtGui import QTextCursor, QFont, QColor, QPalette, QFontMetrics, QKeyEvent
+from PyQt6.QtCore import (
+    Qt, QObject, QThread, pyqtSignal, pyqtSlot, QSize, QTimer, QEvent, QSettings,
+    QSignalBlocker
+)
+from PyQt6.QtGui import (
+    QTextCursor, QFont, QColor, QPalette, QFontMetrics, QKeyEvent, QClipboard
+)
+from PyQt6 import sip
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from string import Template
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from ..core.tier_manager import get_tier_manager
-from ..core.markdown_renderer import render_markdown, get_renderer
+from ..core.markdown_renderer import render_markdown, install_markdown_stylesheet
 from ..core.planning_prompt import get_planning_system_prompt, DEFAULT_SYSTEM_PROMPT
 
 logger = logging.getLogger("ailinux.chat_widget")
 
+# One-pass HTML escaping for plain-text chat messages
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_HTML_ESCAPE_BR_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br>"})
+
+# Static HTML fragments for chat messages, joined around the dynamic parts
+_USER_HEADER_HTML = '<div style="margin: 10px 0;"><span style="color: #4ade80; font-weight: bold; font-size: 14px;">👤 Du:</span></div>'
+_USER_BODY_OPEN = '<div style="margin-left: 10px; padding: 8px; background: #1a1a2e; border-radius: 8px; color: #e0e0e0;">'
+_ASSISTANT_HEADER_OPEN = '<div style="margin: 10px 0;"><span style="color: #3b82f6; font-weight: bold; font-size: 14px;">🤖 NOVA'
+_ASSISTANT_HEADER_CLOSE = ':</span></div>'
+_SYSTEM_HEADER_HTML = '<div style="margin: 10px 0;"><span style="color: #ef4444; font-weight: bold; font-size: 14px;">⚠️ System:</span></div>'
+_SYSTEM_BODY_OPEN = '<div style="margin-left: 10px; padding: 8px; background: #2a1a1a; border-radius: 8px; color: #fca5a5;">'
+_DIV_CLOSE = '</div>'
+_ACTION_BAR_HTML = '<div style="margin: 8px 0 16px 10px;"><span style="color: #666; font-size: 11px;">[📋 Copy] [🚀 An CLI Agent] [💾 Speichern]</span></div>'
+_HR_SUFFIX = "<hr style='border-color: #333; margin: 16px 0;'>"
+
+# Theme color helpers; the palette has only a handful of distinct colors
+@lru_cache(maxsize=128)
+def _hex_to_rgba(hex_color: str, alpha: float) -> str:
+    """Convert '#rrggbb' to a QSS rgba() string"""
+    hex_color = hex_color.lstrip("#")
+    if len(hex_color) >= 6:
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+        return f"rgba({r}, {g}, {b}, {alpha:.2f})"
+    return f"rgba(30, 30, 50, {alpha:.2f})"
+
+
+# sRGB channel byte -> linear light, precomputed for all 256 values
+_SRGB_TO_LINEAR = tuple(
+    s/12.92 if s <= 0.03928 else ((s+0.055)/1.055)**2.4
+    for s in (c/255 for c in range(256))
+)
+
+
+@lru_cache(maxsize=64)
+def _luminance(hex_c: str) -> float:
+    """Relative luminance of a '#rrggbb' color (WCAG)"""
+    r, g, b = bytes.fromhex(hex_c.lstrip("#")[:6])
+    lut = _SRGB_TO_LINEAR
+    return 0.2126*lut[r] + 0.7152*lut[g] + 0.0722*lut[b]
+
+
+def _ensure_contrast(bg_hex: str, fg_hex: str) -> str:
+    """Ensure text is readable - return adjusted text color if needed"""
+    bg_lum = _luminance(bg_hex)
+    fg_lum = _luminance(fg_hex)
+    lighter = max(bg_lum, fg_lum)
+    darker = min(bg_lum, fg_lum)
+    ratio = (lighter + 0.05) / (darker + 0.05)
+
+    # WCAG AA requires 4.5:1 for normal text
+    if ratio >= 4.5:
+        return fg_hex
+    # If contrast is poor, use white or black based on background
+    return "#ffffff" if bg_lum < 0.5 else "#1a1a1a"
+
+# Shared QSettings handle, created on first use
+_SETTINGS: Optional[QSettings] = None
+
+
+def _get_settings() -> QSettings:
+    """Return the module-wide QSettings instance"""
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = QSettings("AILinux", "Client")
+    return _SETTINGS
+
+
+class SettingsCache:
+    """In-memory cache of QSettings reads, keyed by (key, default, type).
+
+    QSettings may hit the registry/INI file on every value() call. Reads
+    are served from memory until invalidate() or set_value() is called.
+    """
+
+    def __init__(self, settings: QSettings):
+        self._settings = settings
+        self._values: Dict[tuple, Any] = {}
+
+    def value(self, key: str, default: Any = None, type: Any = None) -> Any:
+        cache_key = (key, default, type)
+        try:
+            return self._values[cache_key]
+        except KeyError:
+            pass
+        if type is None:
+            value = self._settings.value(key, default)
+        else:
+            value = self._settings.value(key, default, type=type)
+        self._values[cache_key] = value
+        return value
+
+    def set_value(self, key: str, value: Any):
+        self._settings.setValue(key, value)
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop cached reads (settings were changed elsewhere)"""
+        self._values.clear()
+
+
+_SETTINGS_CACHE: Optional[SettingsCache] = None
+
+
+def _get_settings_cache() -> SettingsCache:
+    """Return the module-wide SettingsCache over _get_settings()"""
+    global _SETTINGS_CACHE
+    if _SETTINGS_CACHE is None:
+        _SETTINGS_CACHE = SettingsCache(_get_settings())
+    return _SETTINGS_CACHE
+
+
+# Selector entry that lets the server choose the model
+_AUTO_MODEL: Dict[str, Any] = {
+    'id': None,
+    'name': 'Auto (Default)',
+    'provider': 'auto',
+    'local': False,
+    'is_header': False,
+}
+
+# Provider -> list icon for cloud models
+_PROVIDER_ICONS: Dict[str, str] = {
+    'anthropic': '🟠',
+    'openai': '🟢',
+    'google': '🔵',
+    'mistral': '🟣',
+}
+
+# Shared list item colors (allocated once, not per item; ints skip the
+# color-name parser)
+_HEADER_BG = QColor(0x1a, 0x1a, 0x1a)
+_LOCKED_FG = QColor(0x66, 0x66, 0x66)
+
+# Static stylesheets, built once and shared by every widget instance
+_SELECT_BTN_QSS = """
+QPushButton {
+    background: #333;
+    color: #e0e0e0;
+    border: 1px solid #444;
+    border-radius: 4px;
+    padding: 8px 12px;
+    text-align: left;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: #3a3a3a;
+    border-color: #555;
+}
+QPushButton::menu-indicator {
+    subcontrol-position: right center;
+    right: 8px;
+}
+"""
+
+_POPUP_QSS = """
+QFrame {
+    background: #2a2a2a;
+    border: 1px solid #444;
+    border-radius: 6px;
+}
+"""
+
+_SEARCH_QSS = """
+QLineEdit {
+    background: #333;
+    color: #e0e0e0;
+    border: 1px solid #444;
+    border-radius: 4px;
+    padding: 8px 10px;
+    font-size: 12px;
+}
+QLineEdit:focus {
+    border-color: #3b82f6;
+}
+"""
+
+_LIST_QSS = """
+QListWidget {
+    background: #252525;
+    color: #e0e0e0;
+    border: 1px solid #333;
+    border-radius: 4px;
+    padding: 4px;
+    font-size: 12px;
+}
+QListWidget::item {
+    padding: 8px 10px;
+    border-radius: 4px;
+    margin: 2px 0;
+}
+QListWidget::item:hover {
+    background: #3a3a3a;
+}
+QListWidget::item:selected {
+    background: #3b82f6;
+    color: white;
+}
+QListWidget::item:disabled {
+    color: #666;
+}
+"""
+
+_INPUT_QSS = """
+QPlainTextEdit {
+    background: rgba(20, 20, 30, 0.9);
+    color: #e0e0e0;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 8px;
+    padding: 10px 12px;
+    font-size: 13px;
+    line-height: 1.4;
+}
+QPlainTextEdit:focus {
+    border-color: rgba(59, 130, 246, 0.6);
+    background: rgba(25, 25, 35, 0.95);
+}
+"""
+
+_CHAT_DISPLAY_QSS = """
+QTextEdit {
+    background: rgba(15, 15, 25, 0.85);
+    color: #e0e0e0;
+    border: none;
+    border-radius: 10px;
+    padding: 12px;
+    margin: 4px;
+}
+QScrollBar:vertical {
+    background: rgba(0, 0, 0, 0.2);
+    width: 8px;
+    border-radius: 4px;
+}
+QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.2);
+    border-radius: 4px;
+    min-height: 30px;
+}
+QScrollBar::handle:vertical:hover {
+    background: rgba(255, 255, 255, 0.3);
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0;
+}
+"""
+
+_INPUT_CONTAINER_QSS = """
+background: rgba(25, 25, 35, 0.9);
+border-radius: 10px;
+margin: 4px;
+"""
+
+_SEND_BTN_QSS = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(59, 130, 246, 0.9),
+        stop:1 rgba(99, 102, 241, 0.9));
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 24px;
+    font-weight: bold;
+    font-size: 14px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(37, 99, 235, 1),
+        stop:1 rgba(79, 70, 229, 1));
+}
+QPushButton:pressed {
+    background: rgba(29, 78, 216, 1);
+}
+QPushButton:disabled {
+    background: rgba(60, 60, 70, 0.7);
+    color: rgba(150, 150, 150, 0.7);
+}
+"""
+
+_COPY_BTN_QSS = """
+QPushButton {
+    background: rgba(60, 60, 70, 0.8);
+    color: #a0a0a0;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 6px 12px;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: rgba(80, 80, 90, 1);
+    color: white;
+}
+"""
+
+_CLI_AGENT_BTN_QSS = """
+QPushButton {
+    background: rgba(60, 60, 70, 0.8);
+    color: #a0a0a0;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 6px 12px;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: rgba(59, 130, 246, 0.8);
+    color: white;
+}
+"""
+
+_PLANNING_BTN_QSS = """
+QPushButton {
+    background: rgba(60, 60, 70, 0.8);
+    color: #a0a0a0;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 6px 12px;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: rgba(34, 197, 94, 0.6);
+    color: white;
+}
+QPushButton:checked {
+    background: rgba(34, 197, 94, 0.8);
+    color: white;
+    border: 1px solid #22c55e;
+}
+"""
+
+# Palette-dependent stylesheets, filled in by ChatWidget._build_theme_stylesheets
+_CHAT_QSS_TMPL = Template("""
+QTextEdit {
+    background: $surface_rgba;
+    color: $text_color;
+    border: none;
+    border-radius: ${border_radius}px;
+    padding: 12px;
+    margin: 4px;
+    selection-background-color: $primary;
+    selection-color: white;
+}
+QScrollBar:vertical {
+    background: transparent;
+    width: 10px;
+    border-radius: 5px;
+    margin: 2px;
+}
+QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.2);
+    border-radius: 5px;
+    min-height: 30px;
+}
+QScrollBar::handle:vertical:hover {
+    background: $primary;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+""")
+
+_INPUT_QSS_TMPL = Template("""
+QPlainTextEdit {
+    background: $surface_darker;
+    color: $text_color;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: ${radius_sm}px;
+    padding: 10px 12px;
+    font-size: 13px;
+    selection-background-color: $primary;
+    selection-color: white;
+}
+QPlainTextEdit:focus {
+    border-color: $primary;
+    background: $surface_rgba;
+}
+""")
+
+_SEND_QSS_TMPL = Template("""
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 $primary, stop:1 $secondary);
+    color: white;
+    border: none;
+    border-radius: ${radius_sm}px;
+    padding: 10px 24px;
+    font-weight: bold;
+    font-size: 14px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 $secondary, stop:1 $accent);
+}
+QPushButton:pressed {
+    background: $accent;
+}
+QPushButton:disabled {
+    background: rgba(60, 60, 70, 0.7);
+    color: rgba(150, 150, 150, 0.7);
+}
+""")
+
+_SELECTOR_QSS_TMPL = Template("""
+QPushButton {
+    background: $surface_darker;
+    color: $text_color;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: ${radius_xs}px;
+    padding: 8px 12px;
+    text-align: left;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background: $surface_rgba;
+    border-color: $primary;
+}
+""")
+
 
 class SearchableModelSelector(QWidget):
     """
@@ -39,10 +467,24 @@ class SearchableModelSelector(QWidget):
 
     model_changed = pyqtSignal(object)  # Emits model data
 
+    # Delay before a burst of search keystrokes rebuilds the list
+    FILTER_DEBOUNCE_MS = 70
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.models: List[Dict[str, Any]] = []
         self.filtered_models: List[Dict[str, Any]] = []
+        # Per-model search invariants, parallel to self.models
+        self._names_lower: List[str] = []
+        self._is_header: List[bool] = []
+        self._locked: List[bool] = []
+        self._display_text: List[str] = []
+        # Indices of pickable models (no headers/locked) for wheel browsing
+        self._selectable: List[int] = []
+        self._selectable_pos: Dict[Any, int] = {}
+        # One persistent list item per model, shown/hidden by the filter
+        self._items: List[QListWidgetItem] = []
+        self._visible: List[int] = []
         self.current_model: Optional[Dict[str, Any]] = None
         self.popup_visible = False
 
@@ -57,37 +499,13 @@ class SearchableModelSelector(QWidget):
         # Main button that shows current selection
         self.select_btn = QPushButton("Auto (Default)")
         self.select_btn.setMinimumWidth(120)
-        self.select_btn.setStyleSheet("""
-            QPushButton {
-                background: #333;
-                color: #e0e0e0;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 8px 12px;
-                text-align: left;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-                border-color: #555;
-            }
-            QPushButton::menu-indicator {
-                subcontrol-position: right center;
-                right: 8px;
-            }
-        """)
+        self.select_btn.setStyleSheet(_SELECT_BTN_QSS)
         self.select_btn.clicked.connect(self._toggle_popup)
         layout.addWidget(self.select_btn)
 
         # Popup frame
         self.popup = QFrame(self, Qt.WindowType.Popup)
-        self.popup.setStyleSheet("""
-            QFrame {
-                background: #2a2a2a;
-                border: 1px solid #444;
-                border-radius: 6px;
-            }
-        """)
+        self.popup.setStyleSheet(_POPUP_QSS)
         popup_layout = QVBoxLayout(self.popup)
         popup_layout.setContentsMargins(8, 8, 8, 8)
         popup_layout.setSpacing(6)
@@ -95,20 +513,12 @@ class SearchableModelSelector(QWidget):
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search models...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background: #333;
-                color: #e0e0e0;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 8px 10px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #3b82f6;
-            }
-        """)
-        self.search_input.textChanged.connect(self._filter_models)
+        self.search_input.setStyleSheet(_SEARCH_QSS)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_search_filter)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         self.search_input.installEventFilter(self)
         popup_layout.addWidget(self.search_input)
 
@@ -116,31 +526,11 @@ class SearchableModelSelector(QWidget):
         self.model_list = QListWidget()
         self.model_list.setMinimumHeight(300)
         self.model_list.setMinimumWidth(350)
-        self.model_list.setStyleSheet("""
-            QListWidget {
-                background: #252525;
-                color: #e0e0e0;
-                border: 1px solid #333;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 12px;
-            }
-            QListWidget::item {
-                padding: 8px 10px;
-                border-radius: 4px;
-                margin: 2px 0;
-            }
-            QListWidget::item:hover {
-                background: #3a3a3a;
-            }
-            QListWidget::item:selected {
-                background: #3b82f6;
-                color: white;
-            }
-            QListWidget::item:disabled {
-                color: #666;
-            }
-        """)
+        self.model_list.setStyleSheet(_LIST_QSS)
+        # All rows share one height: skip per-item measuring, lay out in batches
+        self.model_list.setUniformItemSizes(True)
+        self.model_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.model_list.setBatchSize(50)
         self.model_list.itemClicked.connect(self._on_item_clicked)
         self.model_list.itemDoubleClicked.connect(self._on_item_double_clicked)
         popup_layout.addWidget(self.model_list)
@@ -156,17 +546,23 @@ class SearchableModelSelector(QWidget):
         """Handle keyboard events in search"""
         if obj == self.search_input and event.type() == QEvent.Type.KeyPress:
             key = event.key()
+            if key in (Qt.Key.Key_Down, Qt.Key.Key_Return) and self._filter_timer.isActive():
+                # Navigating the list: apply the pending search first
+                self._filter_timer.stop()
+                self._apply_search_filter()
             if key == Qt.Key.Key_Down:
                 self.model_list.setFocus()
-                if self.model_list.count() > 0:
-                    self.model_list.setCurrentRow(0)
+                if self._visible:
+                    self.model_list.setCurrentRow(self._visible[0])
                 return True
             elif key == Qt.Key.Key_Escape:
                 self._hide_popup()
                 return True
             elif key == Qt.Key.Key_Return:
-                if self.model_list.currentItem():
-                    self._on_item_double_clicked(self.model_list.currentItem())
+                item = self.model_list.currentItem()
+                row = self.model_list.currentRow()
+                if item is not None and not item.isHidden() and not self._is_header[row]:
+                    self._on_item_double_clicked(item)
                 return True
         return super().eventFilter(obj, event)
 
@@ -175,27 +571,22 @@ class SearchableModelSelector(QWidget):
         if not self.popup_visible:
             # Cycle through models with wheel
             delta = event.angleDelta().y()
-            if delta != 0 and self.models:
-                current_idx = -1
+            selectable = self._selectable
+            if delta != 0 and selectable:
+                pos = None
                 if self.current_model:
-                    for i, m in enumerate(self.models):
-                        if m.get('id') == self.current_model.get('id'):
-                            current_idx = i
-                            break
+                    pos = self._selectable_pos.get(self.current_model.get('id'))
 
-                if delta > 0:  # Scroll up = previous
-                    new_idx = max(0, current_idx - 1)
+                if pos is None:
+                    pos = 0
+                elif delta > 0:  # Scroll up = previous
+                    pos = max(0, pos - 1)
                 else:  # Scroll down = next
-                    new_idx = min(len(self.models) - 1, current_idx + 1)
-
-                # Skip headers
-                while new_idx < len(self.models) and self.models[new_idx].get('is_header'):
-                    new_idx += 1 if delta < 0 else -1
+                    pos = min(len(selectable) - 1, pos + 1)
 
-                if 0 <= new_idx < len(self.models):
-                    model = self.models[new_idx]
-                    if not model.get('is_header') and not model.get('locked'):
-                        self._select_model(model)
+                model = self.models[selectable[pos]]
+                if model is not self.current_model:
+                    self._select_model(model)
 
             event.accept()
         else:
@@ -204,8 +595,51 @@ class SearchableModelSelector(QWidget):
     def set_models(self, models: List[Dict[str, Any]]):
         """Set available models"""
         self.models = models
-        self.filtered_models = models.copy()
-        self._update_list()
+        is_header, names, locked, texts, selectable, selectable_pos = [], [], [], [], [], {}
+        item_text = self._item_text
+
+        # Read each model dict once; everything after works on these arrays
+        for i, m in enumerate(models):
+            get = m.get
+            header = bool(get('is_header'))
+            lock = bool(get('locked'))
+            is_header.append(header)
+            locked.append(lock)
+            names.append('' if header else get('name', '').lower())
+            texts.append(item_text(m))
+            if not header and not lock:
+                selectable_pos[get('id')] = len(selectable)
+                selectable.append(i)
+
+        self._is_header = is_header
+        self._names_lower = names
+        self._locked = locked
+        self._display_text = texts
+        self._selectable = selectable
+        self._selectable_pos = selectable_pos
+        self._build_items()
+        # Sets filtered_models/_visible (keeps an open popup's search applied)
+        self._filter_models(self.search_input.text())
+
+    @staticmethod
+    def _item_text(model: Dict[str, Any]) -> str:
+        """List text for a header or model entry"""
+        if model.get('is_header'):
+            return model['name']
+
+        name = model.get('name', 'Unknown')
+        if model.get('locked'):
+            return f"🔒 {name}"
+        if model.get('local'):
+            return f"💻 {name}"
+
+        # Cloud model with provider icon
+        icon = _PROVIDER_ICONS.get(model.get('provider', ''), '☁️')
+        return f"{icon} {name}"
+
+    def show_loading(self):
+        """Indicate that the model list is being fetched"""
+        self.info_label.setText("Loading models...")
 
     def _toggle_popup(self):
         """Toggle popup visibility"""
@@ -223,84 +657,99 @@ class SearchableModelSelector(QWidget):
         self.popup_visible = True
         self.search_input.setFocus()
         self.search_input.clear()
+        self._filter_timer.stop()
         self._filter_models("")
 
     def _hide_popup(self):
         """Hide popup"""
+        self._filter_timer.stop()
         self.popup.hide()
         self.popup_visible = False
 
+    def _apply_search_filter(self):
+        """Debounced search: filter by the text typed so far"""
+        self._filter_models(self.search_input.text())
+
     def _filter_models(self, text: str):
         """Filter models by search text"""
-        text = text.lower().strip()
-        self.filtered_models = []
-
-        for model in self.models:
-            if model.get('is_header'):
-                self.filtered_models.append(model)
-            elif text == "" or text in model.get('name', '').lower():
-                self.filtered_models.append(model)
-
-        # Remove empty headers
-        cleaned = []
-        for i, model in enumerate(self.filtered_models):
-            if model.get('is_header'):
-                # Check if next non-header item exists
-                has_items = False
-                for j in range(i + 1, len(self.filtered_models)):
-                    if self.filtered_models[j].get('is_header'):
-                        break
-                    has_items = True
-                    break
-                if has_items:
-                    cleaned.append(model)
-            else:
-                cleaned.append(model)
-
-        self.filtered_models = cleaned
+        tokens = text.lower().split()
+        models = self.models
+        is_header = self._is_header
+        names = self._names_lower
+
+        # Headers always pass the match; models match on their lowercase name
+        # (every whitespace-separated token must occur, in any order)
+        if not tokens:
+            keep = list(range(len(models)))
+        elif len(tokens) == 1:
+            needle = tokens[0]
+            keep = [i for i, name in enumerate(names) if is_header[i] or needle in name]
+        else:
+            keep = [
+                i for i, name in enumerate(names)
+                if is_header[i] or all(tok in name for tok in tokens)
+            ]
+
+        # Drop headers not directly followed by a model
+        last = len(keep) - 1
+        self._visible = [
+            i for n, i in enumerate(keep)
+            if not is_header[i] or (n < last and not is_header[keep[n + 1]])
+        ]
+        self.filtered_models = [models[i] for i in self._visible]
         self._update_list()
 
+    @contextmanager
+    def _batched_list_update(self):
+        """Suspend repaints and signals of model_list, then repaint once"""
+        model_list = self.model_list
+        model_list.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(model_list)
+        try:
+            yield
+        finally:
+            blocker.unblock()
+            model_list.setUpdatesEnabled(True)
+            model_list.viewport().update()
+
+    def _build_items(self):
+        """Create the list items for self.models (done once per set_models)"""
+        with self._batched_list_update():
+            self.model_list.clear()
+            self._items = []
+
+            for model, text, header, locked in zip(
+                self.models, self._display_text, self._is_header, self._locked
+            ):
+                item = QListWidgetItem(text)
+                if header:
+                    item.setFlags(Qt.ItemFlag.NoItemFlags)
+                    item.setBackground(_HEADER_BG)
+                    font = item.font()
+                    font.setBold(True)
+                    item.setFont(font)
+                elif locked:
+                    item.setForeground(_LOCKED_FG)
+
+                item.setData(Qt.ItemDataRole.UserRole, model)
+                self.model_list.addItem(item)
+                self._items.append(item)
+
     def _update_list(self):
-        """Update list widget"""
-        self.model_list.clear()
-
-        for model in self.filtered_models:
-            item = QListWidgetItem()
-
-            if model.get('is_header'):
-                # Header item
-                item.setText(model['name'])
-                item.setFlags(Qt.ItemFlag.NoItemFlags)
-                item.setBackground(QColor("#1a1a1a"))
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-            else:
-                # Model item
-                name = model.get('name', 'Unknown')
-                provider = model.get('provider', '')
-
-                if model.get('locked'):
-                    item.setText(f"🔒 {name}")
-                    item.setForeground(QColor("#666"))
-                elif model.get('local'):
-                    item.setText(f"💻 {name}")
-                else:
-                    # Cloud model with provider icon
-                    icons = {
-                        'anthropic': '🟠',
-                        'openai': '🟢',
-                        'google': '🔵',
-                        'mistral': '🟣',
-                    }
-                    icon = icons.get(provider, '☁️')
-                    item.setText(f"{icon} {name}")
-
-            item.setData(Qt.ItemDataRole.UserRole, model)
-            self.model_list.addItem(item)
+        """Show the items of the current filter result, hide the rest"""
+        shown = self._visible
+        visible = set(shown)
+        with self._batched_list_update():
+            for i, item in enumerate(self._items):
+                item.setHidden(i not in visible)
+            # Items survive filtering, so a filtered-out highlight must not
+            # stay current (Return would select an invisible model)
+            if self.model_list.currentRow() not in visible:
+                self.model_list.setCurrentRow(-1)
 
         # Update info
-        total = len([m for m in self.filtered_models if not m.get('is_header')])
+        is_header = self._is_header
+        total = sum(1 for i in shown if not is_header[i])
         self.info_label.setText(f"{total} models available • Scroll to browse")
 
     def _on_item_clicked(self, item: QListWidgetItem):
@@ -374,24 +823,14 @@ class PromptInput(QPlainTextEdit):
         # Start with 2 lines height for better visibility
         self.setFixedHeight(self.MIN_HEIGHT)
 
-        # Connect to auto-resize
-        self.textChanged.connect(self._auto_resize)
-
-        self.setStyleSheet("""
-            QPlainTextEdit {
-                background: rgba(20, 20, 30, 0.9);
-                color: #e0e0e0;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 13px;
-                line-height: 1.4;
-            }
-            QPlainTextEdit:focus {
-                border-color: rgba(59, 130, 246, 0.6);
-                background: rgba(25, 25, 35, 0.95);
-            }
-        """)
+        # Connect to auto-resize, coalesced to one resize per event-loop tick
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._do_resize)
+        self.textChanged.connect(self._resize_timer.start)
+
+        self.setStyleSheet(_INPUT_QSS)
 
     def keyPressEvent(self, event: QKeyEvent):
         """Handle Enter vs Shift+Enter"""
@@ -405,11 +844,10 @@ class PromptInput(QPlainTextEdit):
         else:
             super().keyPressEvent(event)
 
-    def _auto_resize(self):
+    def _do_resize(self):
         """Auto-resize based on content up to MAX_LINES"""
-        # Count actual lines
-        text = self.toPlainText()
-        line_count = text.count('\n') + 1
+        # Count actual lines (Qt keeps one block per line, no text copy)
+        line_count = self.document().blockCount()
 
         # Calculate height based on line count
         new_height = self.MIN_HEIGHT + max(0, line_count - 1) * self.LINE_HEIGHT
@@ -417,7 +855,9 @@ class PromptInput(QPlainTextEdit):
         # Clamp to min/max
         new_height = max(self.MIN_HEIGHT, min(self.MAX_HEIGHT, new_height))
 
-        self.setFixedHeight(new_height)
+        # Typing within a line keeps the height - skip the relayout
+        if new_height != self.height():
+            self.setFixedHeight(new_height)
 
     def get_text(self) -> str:
         """Get text content"""
@@ -429,254 +869,104 @@ class PromptInput(QPlainTextEdit):
         self.setFixedHeight(self.MIN_HEIGHT)
 
 
-class ChatWorker(QThread):
-    """Background worker for chat requests with Planning Mode support and timing"""
-    finished = pyqtSignal(dict)
+def _release_thread(thread: QThread, timeout_ms: int) -> bool:
+    """
+    Wait up to timeout_ms for a thread to finish.
+
+    A thread still blocked after that (e.g. in an HTTP request) is abandoned:
+    it is detached from its parent and handed to C++, so teardown never
+    destroys a running QThread, which Qt answers with an abort.
+    """
+    if thread.wait(timeout_ms):
+        return True
+    logger.warning(f"{type(thread).__name__} still busy at shutdown, abandoning it")
+    thread.setParent(None)
+    sip.transferto(thread, None)
+    return False
+
+
+class ChatWorker(QObject):
+    """Chat request worker with Planning Mode support and timing.
+
+    Lives on one long-running QThread; requests arrive through the queued
+    submit() slot and are handled one after another.
+    """
+    response_ready = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, api_client, message: str, model: str = None, system_prompt: str = None):
+    def __init__(self, api_client):
         super().__init__()
         self.api_client = api_client
-        self.message = message
-        self.model = model
-        self.system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
 
-    def run(self):
-        import time
+    @pyqtSlot(str, object, object)
+    def submit(self, message: str, model: Optional[str] = None, system_prompt: Optional[str] = None):
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             result = self.api_client.chat(
-                message=self.message,
-                model=self.model,
-                system_prompt=self.system_prompt
+                message=message,
+                model=model,
+                system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT
             )
             # Add response time to result
-            result["response_time_ms"] = int((time.time() - start_time) * 1000)
-            self.finished.emit(result)
+            result["response_time_ms"] = int((time.monotonic() - start_time) * 1000)
+            self.response_ready.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
 
-class ChatWidget(QWidget):
-    """
-    Chat interface widget
+class ModelLoader(QThread):
+    """Background worker that fetches the model list for the selector.
 
-    Features:
-    - Message history display
-    - Input field with send button
-    - Model selection
-    - Loading indicator
+    Touches no widget state: the refreshed Ollama cache travels back
+    with the models through the loaded signal.
     """
+    # selector entries, (monotonic time, ollama models) or None
+    loaded = pyqtSignal(list, object)
 
-    def __init__(self, api_client, parent=None):
+    def __init__(self, api_client, ollama_client, ollama_cache: Optional[tuple],
+                 cache_ttl: float, parent=None):
         super().__init__(parent)
         self.api_client = api_client
-        self.worker: Optional[ChatWorker] = None
-        self.messages: List[dict] = []
-        self.settings = QSettings("AILinux", "Client")
-
-        self._setup_ui()
-        self._apply_theme_colors()
-
-    def _setup_ui(self):
-        """Setup UI"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
-        # Chat history
-        self.chat_display = QTextEdit()
-        self.chat_display.setReadOnly(True)
-        self.chat_display.setFont(QFont("Monospace", 11))
-        self.chat_display.setStyleSheet("""
-            QTextEdit {
-                background: rgba(15, 15, 25, 0.85);
-                color: #e0e0e0;
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                margin: 4px;
-            }
-            QScrollBar:vertical {
-                background: rgba(0, 0, 0, 0.2);
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 4px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.3);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-        """)
-        layout.addWidget(self.chat_display, 1)
-
-        # Input area container
-        input_container = QWidget()
-        input_container.setStyleSheet("""
-            background: rgba(25, 25, 35, 0.9);
-            border-radius: 10px;
-            margin: 4px;
-        """)
-        input_container.setMaximumHeight(400)  # Max height for input area
-        container_layout = QVBoxLayout(input_container)
-        container_layout.setContentsMargins(10, 8, 10, 10)
-        container_layout.setSpacing(6)
-
-        # Row 1: Hint label (Enter/Shift+Enter explanation)
-        hint_label = QLabel("Enter: Senden  •  Shift+Enter: Neue Zeile")
-        hint_label.setStyleSheet("color: #666; font-size: 11px;")
-        hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        container_layout.addWidget(hint_label)
-
-        # Row 2: Model selector (full width)
-        model_row = QWidget()
-        model_row.setMaximumHeight(40)
-        model_layout = QHBoxLayout(model_row)
-        model_layout.setContentsMargins(0, 0, 0, 0)
-        model_layout.setSpacing(8)
-
-        model_label = QLabel("Modell:")
-        model_label.setStyleSheet("color: #888; font-size: 12px;")
-        model_label.setFixedWidth(50)
-        model_layout.addWidget(model_label)
+        self.ollama_client = ollama_client
+        self._ollama_cache = ollama_cache
+        self._cache_ttl = cache_ttl
 
-        self.model_selector = SearchableModelSelector()
-        self.model_selector.setMaximumHeight(36)
-        self._load_models()
-        model_layout.addWidget(self.model_selector, 1)
-
-        container_layout.addWidget(model_row)
-
-        # Row 3: Prompt text field (expandable up to 10 lines)
-        self.input_field = PromptInput()
-        self.input_field.send_requested.connect(self._send_message)
-        container_layout.addWidget(self.input_field)
+    def run(self):
+        try:
+            models = self._collect_models()
+        except Exception as e:
+            logger.warning(f"Failed to load models: {e}")
+            models = [_AUTO_MODEL.copy()]
+        self.loaded.emit(models, self._ollama_cache)
 
-        # Row 4: Full-width Send button
-        self.send_btn = QPushButton("Senden")
-        self.send_btn.setFixedHeight(38)
-        self.send_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.send_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(59, 130, 246, 0.9),
-                    stop:1 rgba(99, 102, 241, 0.9));
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 24px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(37, 99, 235, 1),
-                    stop:1 rgba(79, 70, 229, 1));
-            }
-            QPushButton:pressed {
-                background: rgba(29, 78, 216, 1);
-            }
-            QPushButton:disabled {
-                background: rgba(60, 60, 70, 0.7);
-                color: rgba(150, 150, 150, 0.7);
-            }
-        """)
-        self.send_btn.clicked.connect(self._send_message)
-        container_layout.addWidget(self.send_btn)
+    def _get_ollama_models(self) -> list:
+        """Get Ollama models from local server (cached for cache_ttl seconds)"""
+        if self._ollama_cache is not None:
+            fetched_at, cached = self._ollama_cache
+            if time.monotonic() - fetched_at < self._cache_ttl:
+                return cached
 
-        # Row 5: Action buttons (Copy, CLI Agent, Settings)
-        action_row = QHBoxLayout()
-        action_row.setSpacing(8)
-        
-        self.copy_btn = QPushButton("📋 Copy")
-        self.copy_btn.setFixedHeight(32)
-        self.copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.copy_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(60, 60, 70, 0.8);
-                color: #a0a0a0;
-                border: 1px solid #444;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: rgba(80, 80, 90, 1);
-                color: white;
-            }
-        """)
-        self.copy_btn.clicked.connect(self.copy_last_response)
-        action_row.addWidget(self.copy_btn)
-        
-        self.cli_agent_btn = QPushButton("🚀 An CLI Agent")
-        self.cli_agent_btn.setFixedHeight(32)
-        self.cli_agent_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.cli_agent_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(60, 60, 70, 0.8);
-                color: #a0a0a0;
-                border: 1px solid #444;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: rgba(59, 130, 246, 0.8);
-                color: white;
-            }
-        """)
-        self.cli_agent_btn.clicked.connect(lambda: self.send_to_cli_agent("claude-mcp"))
-        action_row.addWidget(self.cli_agent_btn)
-        
-        self.planning_btn = QPushButton("🗺️ Planungsmodus")
-        self.planning_btn.setFixedHeight(32)
-        self.planning_btn.setCheckable(True)
-        self.planning_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.planning_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(60, 60, 70, 0.8);
-                color: #a0a0a0;
-                border: 1px solid #444;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: rgba(34, 197, 94, 0.6);
-                color: white;
-            }
-            QPushButton:checked {
-                background: rgba(34, 197, 94, 0.8);
-                color: white;
-                border: 1px solid #22c55e;
-            }
-        """)
-        self.planning_btn.setChecked(True)
-        action_row.addWidget(self.planning_btn)
-        
-        action_row.addStretch()
-        container_layout.addLayout(action_row)
+        try:
+            ollama = self.ollama_client
+            if not ollama.is_available():
+                logger.info("Ollama not available")
+                models = []
+            else:
+                # Convert OllamaModel objects to dicts
+                models = [{"name": m.name, "id": m.name, "size": m.size} for m in ollama.get_models()]
+        except Exception as e:
+            logger.warning(f"Failed to get Ollama models: {e}")
+            return []
 
-        layout.addWidget(input_container)
+        self._ollama_cache = (time.monotonic(), models)
+        return models
 
-    def _load_models(self):
-        """Load available models from server (tier-based) or fallback to local"""
+    def _collect_models(self) -> list:
+        """Build the selector entries from server (tier-based) or fallback to local"""
         models = []
 
         # Auto option (always first)
-        models.append({
-            'id': None,
-            'name': 'Auto (Default)',
-            'provider': 'auto',
-            'local': False,
-            'is_header': False,
-        })
+        models.append(_AUTO_MODEL.copy())
 
         # Try to get models from server first
         if self.api_client and self.api_client.is_authenticated():
@@ -728,9 +1018,8 @@ class ChatWidget(QWidget):
                         })
                         models.extend(cloud_models)
 
-                    self.model_selector.set_models(models)
                     logger.info(f"Loaded {len(ollama_models)} Ollama + {len(cloud_models)} cloud models from server (tier: {tier})")
-                    return
+                    return models
 
             except Exception as e:
                 logger.warning(f"Failed to get models from server: {e}")
@@ -774,28 +1063,225 @@ class ChatWidget(QWidget):
                     'reason': model.get('reason', ''),
                 })
 
-        self.model_selector.set_models(models)
         logger.info(f"Loaded {len(model_groups.get('ollama', []))} Ollama + {len(model_groups.get('cloud', []))} cloud models (fallback)")
+        return models
 
 
-    def _get_ollama_models(self) -> list:
-        """Get Ollama models from local server"""
-        try:
-            from ..core.ollama_client import OllamaClient
-            ollama = OllamaClient()
-            if not ollama.is_available():
-                logger.info("Ollama not available")
-                return []
+class ChatWidget(QWidget):
+    """
+    Chat interface widget
 
-            models = ollama.get_models()
-            # Convert OllamaModel objects to dicts
-            return [{"name": m.name, "id": m.name, "size": m.size} for m in models]
-        except Exception as e:
-            logger.warning(f"Failed to get Ollama models: {e}")
-            return []
+    Features:
+    - Message history display
+    - Input field with send button
+    - Model selection
+    - Loading indicator
+    """
+
+    # Theme signature -> generated stylesheets, shared by all instances
+    _THEME_QSS_CACHE: Dict[tuple, tuple] = {}
+
+    # Cap on chat messages kept in self.messages and in the display; the
+    # oldest message is trimmed from both as a whole
+    MAX_HISTORY_MESSAGES = 500
+
+    # Seconds a local Ollama model listing is reused before re-probing
+    OLLAMA_CACHE_TTL = 30.0
+
+    # How long quitting waits for a running request before abandoning it
+    SHUTDOWN_WAIT_MS = 2000
+
+    # message, model, system_prompt -> ChatWorker.submit on the chat thread
+    _chat_requested = pyqtSignal(str, object, object)
 
-    def refresh_models(self):
+    def __init__(self, api_client, parent=None):
+        super().__init__(parent)
+        self.api_client = api_client
+        self.worker: Optional[ChatWorker] = None
+        self._model_loader: Optional[ModelLoader] = None
+        self._models_reload_pending = False
+        # Shared local Ollama client and (monotonic time, models) cache
+        self._ollama_client = None
+        self._ollama_cache: Optional[tuple] = None
+        # Bounded so long sessions don't grow forever
+        self.messages: Deque[dict] = deque(maxlen=self.MAX_HISTORY_MESSAGES)
+        # Display position where each message in self.messages starts
+        self._message_starts: Deque[QTextCursor] = deque()
+        self.settings = _get_settings()
+        self._settings_cache = _get_settings_cache()
+        self._theme_sig: Optional[tuple] = None
+        # Set once _setup_ui has created every widget the theme styles
+        self._widgets_ready = False
+        self._clipboard = QApplication.clipboard()
+        # Fenced code blocks of the last assistant response
+        self._last_ai_code_blocks: Tuple[dict, ...] = ()
+
+        self._setup_ui()
+        self._apply_theme_colors()
+        self._start_chat_worker()
+
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_threads)
+
+    def _start_chat_worker(self):
+        """Create the chat worker and its long-lived thread (once per widget)"""
+        self._chat_thread = QThread(self)
+        self.worker = ChatWorker(self.api_client)
+        self.worker.moveToThread(self._chat_thread)
+
+        # Worker signals always cross threads - queue them explicitly
+        self._chat_requested.connect(self.worker.submit, Qt.ConnectionType.QueuedConnection)
+        self.worker.response_ready.connect(self._on_response, Qt.ConnectionType.QueuedConnection)
+        self.worker.error.connect(self._on_error, Qt.ConnectionType.QueuedConnection)
+        self._chat_thread.finished.connect(self.worker.deleteLater)
+        self._chat_thread.start()
+
+    def _stop_threads(self):
+        """Shut down the background threads before the application exits"""
+        self._stop_chat_worker()
+        if self._model_loader is not None and self._model_loader.isRunning():
+            _release_thread(self._model_loader, self.SHUTDOWN_WAIT_MS)
+
+    def _stop_chat_worker(self):
+        """Stop the chat thread; a request still running is abandoned"""
+        if self._chat_thread.isRunning():
+            self._chat_thread.quit()
+            if not _release_thread(self._chat_thread, self.SHUTDOWN_WAIT_MS):
+                # The late response must not reach a widget being torn down
+                self.worker.response_ready.disconnect(self._on_response)
+                self.worker.error.disconnect(self._on_error)
+
+    def _setup_ui(self):
+        """Setup UI"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        # Chat history
+        self.chat_display = QTextEdit()
+        self.chat_display.setReadOnly(True)
+        self.chat_display.setFont(QFont("Monospace", 11))
+        install_markdown_stylesheet(self.chat_display)
+        # Append-only cursor on the document: new messages are inserted at
+        # the end, the transcript is never re-rendered as a whole
+        self._append_cursor = QTextCursor(self.chat_display.document())
+        self.chat_display.setStyleSheet(_CHAT_DISPLAY_QSS)
+        layout.addWidget(self.chat_display, 1)
+
+        # Input area container
+        input_container = QWidget()
+        input_container.setStyleSheet(_INPUT_CONTAINER_QSS)
+        input_container.setMaximumHeight(400)  # Max height for input area
+        container_layout = QVBoxLayout(input_container)
+        container_layout.setContentsMargins(10, 8, 10, 10)
+        container_layout.setSpacing(6)
+
+        # Row 1: Hint label (Enter/Shift+Enter explanation)
+        hint_label = QLabel("Enter: Senden  •  Shift+Enter: Neue Zeile")
+        hint_label.setStyleSheet("color: #666; font-size: 11px;")
+        hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        container_layout.addWidget(hint_label)
+
+        # Row 2: Model selector (full width)
+        model_row = QWidget()
+        model_row.setMaximumHeight(40)
+        model_layout = QHBoxLayout(model_row)
+        model_layout.setContentsMargins(0, 0, 0, 0)
+        model_layout.setSpacing(8)
+
+        model_label = QLabel("Modell:")
+        model_label.setStyleSheet("color: #888; font-size: 12px;")
+        model_label.setFixedWidth(50)
+        model_layout.addWidget(model_label)
+
+        self.model_selector = SearchableModelSelector()
+        self.model_selector.setMaximumHeight(36)
+        self._load_models()
+        model_layout.addWidget(self.model_selector, 1)
+
+        container_layout.addWidget(model_row)
+
+        # Row 3: Prompt text field (expandable up to 10 lines)
+        self.input_field = PromptInput()
+        self.input_field.send_requested.connect(self._send_message)
+        container_layout.addWidget(self.input_field)
+
+        # Row 4: Full-width Send button
+        self.send_btn = QPushButton("Senden")
+        self.send_btn.setFixedHeight(38)
+        self.send_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.send_btn.setStyleSheet(_SEND_BTN_QSS)
+        self.send_btn.clicked.connect(self._send_message)
+        container_layout.addWidget(self.send_btn)
+
+        # Row 5: Action buttons (Copy, CLI Agent, Settings)
+        action_row = QHBoxLayout()
+        action_row.setSpacing(8)
+        
+        self.copy_btn = QPushButton("📋 Copy")
+        self.copy_btn.setFixedHeight(32)
+        self.copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.copy_btn.setStyleSheet(_COPY_BTN_QSS)
+        self.copy_btn.clicked.connect(self.copy_last_response)
+        action_row.addWidget(self.copy_btn)
+        
+        self.cli_agent_btn = QPushButton("🚀 An CLI Agent")
+        self.cli_agent_btn.setFixedHeight(32)
+        self.cli_agent_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cli_agent_btn.setStyleSheet(_CLI_AGENT_BTN_QSS)
+        self.cli_agent_btn.clicked.connect(lambda: self.send_to_cli_agent("claude-mcp"))
+        action_row.addWidget(self.cli_agent_btn)
+        
+        self.planning_btn = QPushButton("🗺️ Planungsmodus")
+        self.planning_btn.setFixedHeight(32)
+        self.planning_btn.setCheckable(True)
+        self.planning_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.planning_btn.setStyleSheet(_PLANNING_BTN_QSS)
+        self.planning_btn.setChecked(True)
+        action_row.addWidget(self.planning_btn)
+        
+        action_row.addStretch()
+        container_layout.addLayout(action_row)
+
+        layout.addWidget(input_container)
+        self._widgets_ready = True
+
+    def _load_models(self):
+        """Load available models in the background (server, then local fallback)"""
+        if self._model_loader is not None and self._model_loader.isRunning():
+            # Reload once the running fetch is done
+            self._models_reload_pending = True
+            return
+
+        self.model_selector.show_loading()
+        if self._ollama_client is None:
+            from ..core.ollama_client import OllamaClient
+            self._ollama_client = OllamaClient()
+        loader = ModelLoader(
+            self.api_client, self._ollama_client, self._ollama_cache,
+            self.OLLAMA_CACHE_TTL, parent=self
+        )
+        loader.loaded.connect(self._on_models_loaded)
+        loader.finished.connect(loader.deleteLater)
+        self._model_loader = loader
+        loader.start()
+
+    def _on_models_loaded(self, models: list, ollama_cache: Optional[tuple]):
+        """Populate the selector with the models fetched by ModelLoader"""
+        self._model_loader = None
+        # A reload queued meanwhile (refresh_models) wants a fresh probe
+        if not self._models_reload_pending:
+            self._ollama_cache = ollama_cache
+        self.model_selector.set_models(models)
+        if self._models_reload_pending:
+            self._models_reload_pending = False
+            self._load_models()
+
+    def refresh_models(self, force: bool = False):
         """Refresh model list (called after tier change)"""
+        if force:
+            self._ollama_cache = None
         self._load_models()
 
     def _send_message(self):
@@ -849,11 +1335,8 @@ class ChatWidget(QWidget):
         if hasattr(self, 'planning_btn') and self.planning_btn.isChecked():
             system_prompt = DEFAULT_SYSTEM_PROMPT
         
-        # Start worker
-        self.worker = ChatWorker(self.api_client, message, model, system_prompt)
-        self.worker.finished.connect(self._on_response)
-        self.worker.error.connect(self._on_error)
-        self.worker.start()
+        # Hand the request to the persistent worker thread (queued)
+        self._chat_requested.emit(message, model, system_prompt)
 
     def _on_response(self, result: dict):
         """Handle response and update statusbar"""
@@ -886,37 +1369,51 @@ class ChatWidget(QWidget):
 
     def _add_message(self, role: str, content: str, model: str = None):
         """Add message to display with Markdown rendering for AI responses"""
+        # A full history drops its oldest message; the display follows suit
+        trim = len(self.messages) == self.messages.maxlen
         self.messages.append({"role": role, "content": content, "model": model})
 
         if role == "user":
-            header = '<div style="margin: 10px 0;"><span style="color: #4ade80; font-weight: bold; font-size: 14px;">👤 Du:</span></div>'
-            escaped = content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            escaped = escaped.replace("\n", "<br>")
-            body = f'<div style="margin-left: 10px; padding: 8px; background: #1a1a2e; border-radius: 8px; color: #e0e0e0;">{escaped}</div>'
-            
+            parts = (_USER_HEADER_HTML, _USER_BODY_OPEN,
+                     content.translate(_HTML_ESCAPE_BR_TABLE), _DIV_CLOSE, _HR_SUFFIX)
         elif role == "assistant":
             model_str = f" ({model})" if model else ""
-            header = f'<div style="margin: 10px 0;"><span style="color: #3b82f6; font-weight: bold; font-size: 14px;">🤖 NOVA{model_str}:</span></div>'
-            body = render_markdown(content)
-            
+            rendered = render_markdown(content)
+            # Keep the blocks found while rendering for send_to_cli_agent
+            self._last_ai_code_blocks = rendered.code_blocks
+            parts = (_ASSISTANT_HEADER_OPEN, model_str, _ASSISTANT_HEADER_CLOSE,
+                     rendered, _ACTION_BAR_HTML, _HR_SUFFIX)
         else:
-            header = '<div style="margin: 10px 0;"><span style="color: #ef4444; font-weight: bold; font-size: 14px;">⚠️ System:</span></div>'
-            escaped = content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            body = f'<div style="margin-left: 10px; padding: 8px; background: #2a1a1a; border-radius: 8px; color: #fca5a5;">{escaped}</div>'
-
-        action_bar = ""
-        if role == "assistant":
-            action_bar = '<div style="margin: 8px 0 16px 10px;"><span style="color: #666; font-size: 11px;">[📋 Copy] [🚀 An CLI Agent] [💾 Speichern]</span></div>'
-
-        html = f"{header}{body}{action_bar}<hr style='border-color: #333; margin: 16px 0;'>"
-
-        cursor = self.chat_display.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(html)
-
-        self.chat_display.verticalScrollBar().setValue(
-            self.chat_display.verticalScrollBar().maximum()
-        )
+            parts = (_SYSTEM_HEADER_HTML, _SYSTEM_BODY_OPEN,
+                     content.translate(_HTML_ESCAPE_TABLE), _DIV_CLOSE, _HR_SUFFIX)
+        html = "".join(parts)
+
+        # One edit block and one repaint per message
+        display = self.chat_display
+        cursor = self._append_cursor
+        display.setUpdatesEnabled(False)
+        try:
+            cursor.beginEditBlock()
+            if trim:
+                # Remove whole messages only (never half a table or <pre>)
+                self._message_starts.popleft()
+                cursor.setPosition(0)
+                cursor.setPosition(
+                    self._message_starts[0].position(), QTextCursor.MoveMode.KeepAnchor
+                )
+                cursor.removeSelectedText()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            # Marks this message's start; stays put while the text goes in
+            start = QTextCursor(cursor)
+            start.setKeepPositionOnInsert(True)
+            self._message_starts.append(start)
+            cursor.insertHtml(html)
+            cursor.endEditBlock()
+        finally:
+            display.setUpdatesEnabled(True)
+
+        scrollbar = display.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
         
         if role == "assistant":
             self._last_ai_response = content
@@ -925,15 +1422,14 @@ class ChatWidget(QWidget):
     def copy_last_response(self):
         """Copy last AI response to clipboard"""
         if hasattr(self, '_last_ai_response') and self._last_ai_response:
-            QApplication.clipboard().setText(self._last_ai_response)
+            self._clipboard.setText(self._last_ai_response, QClipboard.Mode.Clipboard)
             logger.info("Response copied to clipboard")
 
     def send_to_cli_agent(self, agent_id: str = "claude-mcp"):
         """Send last AI response to CLI agent"""
         if hasattr(self, '_last_ai_response') and self._last_ai_response:
             try:
-                renderer = get_renderer()
-                code_blocks = renderer.extract_code_blocks(self._last_ai_response)
+                code_blocks = self._last_ai_code_blocks
                 
                 if code_blocks:
                     message = code_blocks[0]["code"]
@@ -958,11 +1454,14 @@ class ChatWidget(QWidget):
     def clear_chat(self):
         """Clear chat history"""
         self.messages.clear()
+        self._message_starts.clear()
         self.chat_display.clear()
 
     def apply_settings(self):
         """Apply settings from QSettings"""
-        settings = QSettings("AILinux", "Client")
+        # Called after the settings dialog saved - re-read everything once
+        settings = self._settings_cache
+        settings.invalidate()
 
         # Default model
         default_model = settings.value("chat_default_model", "")
@@ -1000,146 +1499,57 @@ class ChatWidget(QWidget):
         Apply theme colors from settings to all UI elements.
         Follows WCAG contrast guidelines for visibility.
         """
-        # Read theme colors from settings
-        primary = self.settings.value("theme_color_primary", "#3b82f6")
-        secondary = self.settings.value("theme_color_secondary", "#6366f1")
-        accent = self.settings.value("theme_color_accent", "#8b5cf6")
-        surface = self.settings.value("theme_color_surface", "#1a1a2e")
-        text_color = self.settings.value("theme_color_text", "#e0e0e0")
-        border_radius = self.settings.value("widget_border_radius", 10, type=int)
-        transparency = self.settings.value("widget_transparency", 85, type=int) / 100.0
-
-        # Helper: Convert hex to rgba
-        def hex_to_rgba(hex_color, alpha):
-            hex_color = hex_color.lstrip("#")
-            if len(hex_color) >= 6:
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                return f"rgba({r}, {g}, {b}, {alpha:.2f})"
-            return f"rgba(30, 30, 50, {alpha:.2f})"
-
-        # Helper: Ensure minimum contrast (WCAG)
-        def ensure_contrast(bg_hex, fg_hex):
-            """Ensure text is readable - return adjusted text color if needed"""
-            def luminance(hex_c):
-                hex_c = hex_c.lstrip("#")
-                r, g, b = int(hex_c[0:2], 16)/255, int(hex_c[2:4], 16)/255, int(hex_c[4:6], 16)/255
-                r = r/12.92 if r <= 0.03928 else ((r+0.055)/1.055)**2.4
-                g = g/12.92 if g <= 0.03928 else ((g+0.055)/1.055)**2.4
-                b = b/12.92 if b <= 0.03928 else ((b+0.055)/1.055)**2.4
-                return 0.2126*r + 0.7152*g + 0.0722*b
-
-            bg_lum = luminance(bg_hex)
-            fg_lum = luminance(fg_hex)
-            lighter = max(bg_lum, fg_lum)
-            darker = min(bg_lum, fg_lum)
-            ratio = (lighter + 0.05) / (darker + 0.05)
-
-            # WCAG AA requires 4.5:1 for normal text
-            if ratio >= 4.5:
-                return fg_hex
-            # If contrast is poor, use white or black based on background
-            return "#ffffff" if bg_lum < 0.5 else "#1a1a1a"
+        if not self._widgets_ready:
+            return
 
+        # Read theme colors from settings
+        settings = self._settings_cache
+        primary = settings.value("theme_color_primary", "#3b82f6")
+        secondary = settings.value("theme_color_secondary", "#6366f1")
+        accent = settings.value("theme_color_accent", "#8b5cf6")
+        surface = settings.value("theme_color_surface", "#1a1a2e")
+        text_color = settings.value("theme_color_text", "#e0e0e0")
+        border_radius = settings.value("widget_border_radius", 10, type=int)
+        transparency = settings.value("widget_transparency", 85, type=int) / 100.0
+
+        # Unchanged palette: skip the stylesheet rebuild and widget repolish
+        sig = (primary, secondary, accent, surface, text_color, border_radius, transparency)
+        if sig == self._theme_sig:
+            return
+        self._theme_sig = sig
+
+        stylesheets = self._THEME_QSS_CACHE.get(sig)
+        if stylesheets is None:
+            stylesheets = self._build_theme_stylesheets(*sig)
+            self._THEME_QSS_CACHE[sig] = stylesheets
+        chat_qss, input_qss, send_qss, selector_qss = stylesheets
+
+        self.chat_display.setStyleSheet(chat_qss)
+        self.input_field.setStyleSheet(input_qss)
+        self.send_btn.setStyleSheet(send_qss)
+        self.model_selector.select_btn.setStyleSheet(selector_qss)
+
+    @staticmethod
+    def _build_theme_stylesheets(primary, secondary, accent, surface, text_color,
+                                 border_radius, transparency):
+        """Build the (chat, input, send button, model selector) stylesheets"""
         # Ensure text contrast
-        text_color = ensure_contrast(surface, text_color)
-
-        surface_rgba = hex_to_rgba(surface, transparency)
-        surface_darker = hex_to_rgba(surface, min(1.0, transparency + 0.1))
-
-        # Chat display styling
-        if hasattr(self, 'chat_display'):
-            self.chat_display.setStyleSheet(f"""
-                QTextEdit {{
-                    background: {surface_rgba};
-                    color: {text_color};
-                    border: none;
-                    border-radius: {border_radius}px;
-                    padding: 12px;
-                    margin: 4px;
-                    selection-background-color: {primary};
-                    selection-color: white;
-                }}
-                QScrollBar:vertical {{
-                    background: transparent;
-                    width: 10px;
-                    border-radius: 5px;
-                    margin: 2px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background: rgba(255, 255, 255, 0.2);
-                    border-radius: 5px;
-                    min-height: 30px;
-                }}
-                QScrollBar::handle:vertical:hover {{
-                    background: {primary};
-                }}
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                }}
-            """)
-
-        # Input field styling
-        if hasattr(self, 'input_field'):
-            self.input_field.setStyleSheet(f"""
-                QPlainTextEdit {{
-                    background: {surface_darker};
-                    color: {text_color};
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                    border-radius: {border_radius - 2}px;
-                    padding: 10px 12px;
-                    font-size: 13px;
-                    selection-background-color: {primary};
-                    selection-color: white;
-                }}
-                QPlainTextEdit:focus {{
-                    border-color: {primary};
-                    background: {surface_rgba};
-                }}
-            """)
-
-        # Send button styling with gradient
-        if hasattr(self, 'send_btn'):
-            # Parse primary and secondary for gradient
-            self.send_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 {primary}, stop:1 {secondary});
-                    color: white;
-                    border: none;
-                    border-radius: {border_radius - 2}px;
-                    padding: 10px 24px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 {secondary}, stop:1 {accent});
-                }}
-                QPushButton:pressed {{
-                    background: {accent};
-                }}
-                QPushButton:disabled {{
-                    background: rgba(60, 60, 70, 0.7);
-                    color: rgba(150, 150, 150, 0.7);
-                }}
-            """)
-
-        # Model selector button
-        if hasattr(self, 'model_selector') and hasattr(self.model_selector, 'select_btn'):
-            self.model_selector.select_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {surface_darker};
-                    color: {text_color};
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                    border-radius: {border_radius - 4}px;
-                    padding: 8px 12px;
-                    text-align: left;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background: {surface_rgba};
-                    border-color: {primary};
-                }}
-            """)
+        text_color = _ensure_contrast(surface, text_color)
+
+        values = {
+            "primary": primary,
+            "secondary": secondary,
+            "accent": accent,
+            "text_color": text_color,
+            "surface_rgba": _hex_to_rgba(surface, transparency),
+            "surface_darker": _hex_to_rgba(surface, min(1.0, transparency + 0.1)),
+            "border_radius": border_radius,
+            "radius_sm": border_radius - 2,
+            "radius_xs": border_radius - 4,
+        }
+        return (
+            _CHAT_QSS_TMPL.substitute(values),
+            _INPUT_QSS_TMPL.substitute(values),
+            _SEND_QSS_TMPL.substitute(values),
+            _SELECTOR_QSS_TMPL.substitute(values),
+        )
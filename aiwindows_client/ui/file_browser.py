@@ -7,34 +7,131 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeView, QListView,
     QSplitter, QToolBar, QLineEdit, QComboBox, QMenu,
     QFileSystemModel, QAbstractItemView, QMessageBox,
-    QPushButton, QLabel, QInputDialog, QProgressDialog
+    QPushButton, QLabel, QInputDialog, QProgressDialog, QApplication
 )
-from PyQt6.QtCore import Qt, QDir, QModelIndex, pyqtSignal, QUrl, QMimeData
-from PyQt6.QtGui import QAction, QDesktopServices, QDrag
+from PyQt6.QtCore import (
+    Qt, QModelIndex, QTimer, pyqtSignal, QUrl, QMimeData,
+    QAbstractNativeEventFilter, QCoreApplication, QObject, QRunnable, QThreadPool,
+    QSortFilterProxyModel
+)
+from PyQt6.QtGui import QAction, QClipboard, QDesktopServices, QDrag
 import os
 import sys
 import shutil
 import subprocess
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 logger = logging.getLogger("aiwindows.file_browser")
 
 
-def get_windows_drives():
-    """Get list of available Windows drives"""
+# GetDriveTypeW: DRIVE_REMOVABLE, DRIVE_CDROM (media may be missing)
+_MEDIA_DRIVE_TYPES = (2, 5)
+
+
+@lru_cache(maxsize=1)
+def get_windows_drives() -> Tuple[str, ...]:
+    """Get available Windows drives (cached, see refresh_drives)"""
     drives = []
     if sys.platform == 'win32':
+        import ctypes
         import string
-        for letter in string.ascii_uppercase:
-            drive = f"{letter}:\\"
-            if os.path.exists(drive):
-                drives.append(drive)
+        kernel32 = ctypes.windll.kernel32
+        # Ein Aufruf liefert die Bitmaske aller Laufwerke, ohne jedes
+        # Laufwerk einzeln anzufassen (Netzlaufwerke können hängen)
+        mask = kernel32.GetLogicalDrives()
+        for i, letter in enumerate(string.ascii_uppercase):
+            if mask & (1 << i):
+                root = f"{letter}:\\"
+                # Wechsellaufwerke/CD ohne Medium (leerer Kartenleser)
+                # auslassen; nur diese werden angefasst
+                if (kernel32.GetDriveTypeW(root) in _MEDIA_DRIVE_TYPES
+                        and not os.path.exists(root)):
+                    continue
+                drives.append(root)
     else:
         # Fallback für Entwicklung auf Linux
         drives = [str(Path.home())]
-    return drives
+    # Tupel: alle Aufrufer teilen sich das gecachte Ergebnis
+    return tuple(drives)
+
+
+def refresh_drives():
+    """Drop the cached drive list so the next lookup re-enumerates"""
+    get_windows_drives.cache_clear()
+
+
+WM_DEVICECHANGE = 0x0219
+
+
+class _DeviceChangeFilter(QAbstractNativeEventFilter):
+    """Calls back when Windows broadcasts WM_DEVICECHANGE (drive added/removed)"""
+
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_DEVICECHANGE:
+                self._callback()
+        return False, 0
+
+
+def _remove_native_filter(event_filter):
+    app = QCoreApplication.instance()
+    if app is not None:
+        app.removeNativeEventFilter(event_filter)
+
+
+class _DirOnlyProxy(QSortFilterProxyModel):
+    """Tree view over the shared file system model: folders, name column only"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Whether a row is a folder never changes, so the icon/size updates
+        # (dataChanged) the model streams in need no re-filtering; inserted
+        # rows are still filtered
+        self.setDynamicSortFilter(False)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # One cheap isDir() per row the tree has mapped, files included
+        model = self.sourceModel()
+        return model.isDir(model.index(source_row, 0, source_parent))
+
+    def filterAcceptsColumn(self, source_column, source_parent):
+        return source_column == 0
+
+
+class _DeleteSignals(QObject):
+    """Signals for _DeleteTask (QRunnable is not a QObject)"""
+    # path, error message ("" on success)
+    finished = pyqtSignal(str, str)
+
+
+class _DeleteTask(QRunnable):
+    """Deletes a file or folder on the thread pool"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = _DeleteSignals()
+
+    def run(self):
+        error = ""
+        try:
+            if os.path.isdir(self.path):
+                shutil.rmtree(self.path)
+            else:
+                os.remove(self.path)
+        except Exception as e:
+            error = str(e)
+        # Cross-thread emit: the slot runs queued on the UI thread
+        self.signals.finished.emit(self.path, error)
 
 
 class WindowsFileBrowser(QWidget):
@@ -45,9 +142,19 @@ class WindowsFileBrowser(QWidget):
     file_selected = pyqtSignal(str)
     directory_changed = pyqtSignal(str)
     
+    # Schnelles Navigieren (Zurück halten, Baum durchklicken) meldet nur den Endpfad
+    NAV_DEBOUNCE_MS = 120
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_path = str(Path.home())
+        self._clipboard = QApplication.clipboard()
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(self.NAV_DEBOUNCE_MS)
+        self._nav_timer.timeout.connect(
+            lambda: self.directory_changed.emit(self.current_path)
+        )
         self._setup_ui()
         self._navigate_to(self.current_path)
     
@@ -63,10 +170,15 @@ class WindowsFileBrowser(QWidget):
         # Drive selector (Windows-spezifisch)
         self.drive_combo = QComboBox()
         self.drive_combo.setMinimumWidth(80)
-        drives = get_windows_drives()
-        for drive in drives:
-            self.drive_combo.addItem(drive)
+        self.drive_combo.addItems(get_windows_drives())
         self.drive_combo.currentTextChanged.connect(self._on_drive_changed)
+        if sys.platform == 'win32':
+            self._device_filter = _DeviceChangeFilter(self.refresh_drives)
+            QCoreApplication.instance().installNativeEventFilter(self._device_filter)
+            # Lambda statt gebundener Methode: feuert noch während der Zerstörung
+            self.destroyed.connect(
+                lambda _=None, f=self._device_filter: _remove_native_filter(f)
+            )
         toolbar.addWidget(QLabel("Laufwerk:"))
         toolbar.addWidget(self.drive_combo)
         
@@ -102,27 +214,25 @@ class WindowsFileBrowser(QWidget):
         # Splitter: Tree + List view
         splitter = QSplitter(Qt.Orientation.Horizontal)
         
-        # Tree view (Ordner-Baum)
-        self.tree_model = QFileSystemModel()
-        self.tree_model.setRootPath("")
-        self.tree_model.setFilter(QDir.Filter.Dirs | QDir.Filter.NoDotAndDotDot)
+        # Ein Model für beide Views: ein Watcher, ein Verzeichnis-Cache
+        self.fs_model = QFileSystemModel()
+        self.fs_model.setRootPath("")
+        self.fs_model.directoryLoaded.connect(self._on_directory_loaded)
+        
+        # Tree view (Ordner-Baum): nur Ordner, nur Name-Spalte
+        self.tree_proxy = _DirOnlyProxy(self)
+        self.tree_proxy.setSourceModel(self.fs_model)
         
         self.tree_view = QTreeView()
-        self.tree_view.setModel(self.tree_model)
+        self.tree_view.setModel(self.tree_proxy)
         self.tree_view.setHeaderHidden(True)
-        # Nur Name-Spalte zeigen
-        for i in range(1, self.tree_model.columnCount()):
-            self.tree_view.hideColumn(i)
         self.tree_view.clicked.connect(self._on_tree_clicked)
         self.tree_view.setMaximumWidth(250)
         splitter.addWidget(self.tree_view)
         
         # List view (Dateien)
-        self.list_model = QFileSystemModel()
-        self.list_model.setRootPath("")
-        
         self.list_view = QListView()
-        self.list_view.setModel(self.list_model)
+        self.list_view.setModel(self.fs_model)
         self.list_view.setViewMode(QListView.ViewMode.ListMode)
         self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.list_view.doubleClicked.connect(self._on_item_double_clicked)
@@ -140,6 +250,8 @@ class WindowsFileBrowser(QWidget):
         # History
         self._history = []
         self._history_index = -1
+        
+        self._setup_context_menu()
     
     def _navigate_to(self, path: str):
         """Navigate to path"""
@@ -148,25 +260,31 @@ class WindowsFileBrowser(QWidget):
             return
         
         self.current_path = path
-        self.path_edit.setText(path)
-        
-        # Update list view
-        index = self.list_model.setRootPath(path)
-        self.list_view.setRootIndex(index)
-        
-        # Update tree view
-        tree_index = self.tree_model.index(path)
-        self.tree_view.setCurrentIndex(tree_index)
-        self.tree_view.expand(tree_index)
-        
-        # Update drive combo
-        if sys.platform == 'win32' and len(path) >= 2:
-            drive = path[:3]
-            idx = self.drive_combo.findText(drive)
-            if idx >= 0:
-                self.drive_combo.blockSignals(True)
-                self.drive_combo.setCurrentIndex(idx)
-                self.drive_combo.blockSignals(False)
+        # Alle View-Änderungen in einem Repaint zusammenfassen
+        self.setUpdatesEnabled(False)
+        try:
+            self.path_edit.blockSignals(True)
+            self.path_edit.setText(path)
+            self.path_edit.blockSignals(False)
+            
+            # Update list view
+            index = self.fs_model.setRootPath(path)
+            self.list_view.setRootIndex(index)
+            
+            # Update tree view; Aufklappen erst nach dem Zeichnen der Liste
+            self.tree_view.setCurrentIndex(self._tree_index(path))
+            QTimer.singleShot(0, lambda: self.tree_view.expand(self._tree_index(path)))
+            
+            # Update drive combo
+            if sys.platform == 'win32' and len(path) >= 2:
+                drive = path[:3]
+                idx = self.drive_combo.findText(drive)
+                if idx >= 0:
+                    self.drive_combo.blockSignals(True)
+                    self.drive_combo.setCurrentIndex(idx)
+                    self.drive_combo.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
         
         # History
         if not self._history or self._history[self._history_index] != path:
@@ -174,14 +292,41 @@ class WindowsFileBrowser(QWidget):
             self._history.append(path)
             self._history_index = len(self._history) - 1
         
-        # Status
-        try:
-            items = len(os.listdir(path))
-            self.status_label.setText(f"{items} Elemente in {path}")
-        except:
-            self.status_label.setText(path)
+        # Status: Zählung kommt aus dem Model (siehe _on_directory_loaded),
+        # ein bereits geladenes Verzeichnis liefert sie sofort
+        self._update_status(index)
         
-        self.directory_changed.emit(path)
+        self._nav_timer.start()
+    
+    def _tree_index(self, path: str) -> QModelIndex:
+        """Tree view index for path"""
+        return self.tree_proxy.mapFromSource(self.fs_model.index(path))
+    
+    def _update_status(self, index: QModelIndex):
+        """Show item count of the listed directory"""
+        items = self.fs_model.rowCount(index)
+        if items:
+            self.status_label.setText(f"{items} Elemente in {self.current_path}")
+        else:
+            self.status_label.setText(self.current_path)
+    
+    def _on_directory_loaded(self, path: str):
+        """Model finished scanning a directory"""
+        index = self.list_view.rootIndex()
+        if self.fs_model.filePath(index) == path:
+            self._update_status(index)
+    
+    def refresh_drives(self):
+        """Re-enumerate drives and repopulate the drive selector"""
+        refresh_drives()
+        current = self.drive_combo.currentText()
+        self.drive_combo.blockSignals(True)
+        self.drive_combo.clear()
+        self.drive_combo.addItems(get_windows_drives())
+        idx = self.drive_combo.findText(current)
+        if idx >= 0:
+            self.drive_combo.setCurrentIndex(idx)
+        self.drive_combo.blockSignals(False)
     
     def _on_drive_changed(self, drive: str):
         """Drive selection changed"""
@@ -190,13 +335,13 @@ class WindowsFileBrowser(QWidget):
     
     def _on_tree_clicked(self, index: QModelIndex):
         """Tree item clicked"""
-        path = self.tree_model.filePath(index)
+        path = self.fs_model.filePath(self.tree_proxy.mapToSource(index))
         if os.path.isdir(path):
             self._navigate_to(path)
     
     def _on_item_double_clicked(self, index: QModelIndex):
         """List item double-clicked"""
-        path = self.list_model.filePath(index)
+        path = self.fs_model.filePath(index)
         if os.path.isdir(path):
             self._navigate_to(path)
         elif os.path.isfile(path):
@@ -240,44 +385,61 @@ class WindowsFileBrowser(QWidget):
         """Refresh current directory"""
         self._navigate_to(self.current_path)
     
-    def _show_context_menu(self, pos):
-        """Show context menu"""
-        menu = QMenu(self)
+    def _setup_context_menu(self):
+        """Build the list view context menu once; actions act on _ctx_target_path"""
+        self._ctx_target_path = ""
+        self._ctx_menu = QMenu(self)
+        menu = self._ctx_menu
         
-        # Get selected items
-        indexes = self.list_view.selectedIndexes()
+        self._act_open = menu.addAction("Öffnen")
+        self._act_open.triggered.connect(lambda: self._open_file(self._ctx_target_path))
         
-        if indexes:
-            path = self.list_model.filePath(indexes[0])
-            
-            open_action = menu.addAction("Öffnen")
-            open_action.triggered.connect(lambda: self._open_file(path))
-            
-            if sys.platform == 'win32':
-                explorer_action = menu.addAction("Im Explorer öffnen")
-                explorer_action.triggered.connect(
-                    lambda: subprocess.run(['explorer', '/select,', path])
-                )
-            
-            menu.addSeparator()
-            
-            copy_action = menu.addAction("Kopieren")
-            copy_action.triggered.connect(lambda: self._copy_path(path))
-            
-            delete_action = menu.addAction("Löschen")
-            delete_action.triggered.connect(lambda: self._delete_item(path))
+        self._act_explorer = menu.addAction("Im Explorer öffnen")
+        self._act_explorer.triggered.connect(lambda: self._show_in_explorer(self._ctx_target_path))
         
         menu.addSeparator()
         
-        new_folder = menu.addAction("Neuer Ordner")
-        new_folder.triggered.connect(self._create_folder)
+        self._act_copy = menu.addAction("Kopieren")
+        self._act_copy.triggered.connect(lambda: self._copy_path(self._ctx_target_path))
+        
+        self._act_delete = menu.addAction("Löschen")
+        self._act_delete.triggered.connect(lambda: self._delete_item(self._ctx_target_path))
         
-        menu.exec(self.list_view.mapToGlobal(pos))
+        menu.addSeparator()
+        
+        self._act_new_folder = menu.addAction("Neuer Ordner")
+        self._act_new_folder.triggered.connect(self._create_folder)
+        
+        self._ctx_path_actions = (self._act_open, self._act_copy, self._act_delete)
+    
+    def _show_context_menu(self, pos):
+        """Show context menu"""
+        # Get selected items
+        indexes = self.list_view.selectedIndexes()
+        has_target = bool(indexes)
+        if has_target:
+            self._ctx_target_path = self.fs_model.filePath(indexes[0])
+        
+        for action in self._ctx_path_actions:
+            action.setVisible(has_target)
+        self._act_explorer.setVisible(has_target and sys.platform == 'win32')
+        
+        # Leere Separatoren fasst QMenu von selbst zusammen
+        self._ctx_menu.exec(self.list_view.mapToGlobal(pos))
+    
+    def _show_in_explorer(self, path: str):
+        """Reveal path in Explorer without waiting for it to start"""
+        try:
+            subprocess.Popen(
+                ['explorer', '/select,', path],
+                creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        except OSError as e:
+            logger.warning(f"Explorer konnte nicht gestartet werden: {e}")
     
     def _copy_path(self, path: str):
         """Copy path to clipboard"""
-        from PyQt6.QtWidgets import QApplication
-        QApplication.clipboard().setText(path)
+        self._clipboard.setText(path, QClipboard.Mode.Clipboard)
     
     def _delete_item(self, path: str):
         """Delete file or folder"""
@@ -289,14 +451,24 @@ class WindowsFileBrowser(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                else:
-                    os.remove(path)
-                self._refresh()
-            except Exception as e:
-                QMessageBox.warning(self, "Fehler", f"Löschen fehlgeschlagen: {e}")
+            progress = QProgressDialog(f"Lösche '{name}'...", None, 0, 0, self)
+            progress.setWindowTitle("Löschen")
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(300)
+            
+            task = _DeleteTask(path)
+            task.signals.finished.connect(
+                lambda _path, error: self._on_delete_finished(progress, error)
+            )
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_delete_finished(self, progress: QProgressDialog, error: str):
+        """Background delete completed"""
+        progress.close()
+        progress.deleteLater()
+        if error:
+            QMessageBox.warning(self, "Fehler", f"Löschen fehlgeschlagen: {error}")
+        self._refresh()
     
     def _create_folder(self):
         """Create new folder"""
@@ -5,9 +5,9 @@ AILinux Highlight Frame
 Provides visual highlighting for active/focused widgets with customizable
 glow effects and borders.
 """
-from PyQt6.QtWidgets import QFrame, QVBoxLayout, QWidget, QGraphicsDropShadowEffect
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QColor, QPainter, QPen, QPainterPath
+from PyQt6.QtWidgets import QApplication, QFrame, QWidget
+from PyQt6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, pyqtProperty
+from PyQt6.QtGui import QColor, QPainter, QPen, QPainterPath, QPixmap
 import logging
 
 logger = logging.getLogger("ailinux.highlight_frame")
@@ -21,9 +21,18 @@ class HighlightFrame(QFrame):
     - Animated border glow when active
     - Customizable highlight color
     - Smooth transitions
-    - Drop shadow effect option
+    - Glow effect option (pre-rendered, cached per size)
     """
 
+    # Distinct glow levels; the animation only repaints when the level changes
+    GLOW_STEPS = 8
+
+    # Glow stamp: concentric strokes inside the content margin
+    GLOW_LAYERS = 3
+
+    # Gap between frame edge and content widget (no layout, set by geometry)
+    CONTENT_MARGIN = 3
+
     def __init__(self, widget: QWidget = None, parent=None):
         super().__init__(parent)
         self._is_active = False
@@ -33,26 +42,17 @@ class HighlightFrame(QFrame):
         self._glow_intensity = 0.0
         self._use_shadow = True
 
-        # Setup layout
-        self._layout = QVBoxLayout(self)
-        self._layout.setContentsMargins(3, 3, 3, 3)
-        self._layout.setSpacing(0)
+        # Border + glow rendered once at full alpha; paintEvent only blits it
+        # with an opacity, so an animation frame costs a single drawPixmap
+        self._border_pixmap: QPixmap = None
 
         # Add widget if provided
         self._content_widget = None
         if widget:
             self.set_widget(widget)
 
-        # Setup animation
-        self._animation = QPropertyAnimation(self, b"glow_intensity")
-        self._animation.setDuration(200)
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        # Setup shadow effect
-        self._shadow_effect = QGraphicsDropShadowEffect(self)
-        self._shadow_effect.setBlurRadius(0)
-        self._shadow_effect.setOffset(0, 0)
-        self._shadow_effect.setColor(self._highlight_color)
+        # Glow animation, created on first activation
+        self._animation: QPropertyAnimation = None
 
         # Base style
         self.setStyleSheet("""
@@ -65,10 +65,37 @@ class HighlightFrame(QFrame):
     def set_widget(self, widget: QWidget):
         """Set the content widget"""
         if self._content_widget:
-            self._layout.removeWidget(self._content_widget)
+            self._content_widget.hide()
 
         self._content_widget = widget
-        self._layout.addWidget(widget)
+        widget.setParent(self)
+        self._place_content()
+        widget.show()
+        self.updateGeometry()
+
+    def _place_content(self):
+        """Fit the content widget inside the margin"""
+        m = self.CONTENT_MARGIN
+        self._content_widget.setGeometry(
+            m, m, max(0, self.width() - 2 * m), max(0, self.height() - 2 * m)
+        )
+
+    def sizeHint(self) -> QSize:
+        """Content size hint plus margin, as the old layout reported it"""
+        if self._content_widget is None:
+            return super().sizeHint()
+        m = 2 * self.CONTENT_MARGIN
+        return self._content_widget.sizeHint() + QSize(m, m)
+
+    def minimumSizeHint(self) -> QSize:
+        """Content minimum size plus margin"""
+        if self._content_widget is None:
+            return super().minimumSizeHint()
+        m = 2 * self.CONTENT_MARGIN
+        content = self._content_widget.minimumSizeHint().expandedTo(
+            self._content_widget.minimumSize()
+        )
+        return content + QSize(m, m)
 
     def widget(self) -> QWidget:
         """Get the content widget"""
@@ -79,26 +106,26 @@ class HighlightFrame(QFrame):
         if isinstance(color, str):
             color = QColor(color)
         self._highlight_color = color
-        self._shadow_effect.setColor(color)
+        self._invalidate_border()
         self.update()
 
     def set_border_radius(self, radius: int):
         """Set border radius"""
         self._border_radius = radius
+        self._invalidate_border()
         self.update()
 
     def set_border_width(self, width: int):
         """Set border width"""
         self._border_width = width
+        self._invalidate_border()
         self.update()
 
     def set_use_shadow(self, use_shadow: bool):
         """Enable/disable shadow glow effect"""
         self._use_shadow = use_shadow
-        if use_shadow and self._is_active:
-            self.setGraphicsEffect(self._shadow_effect)
-        else:
-            self.setGraphicsEffect(None)
+        self._invalidate_border()
+        self.update()
 
     @pyqtProperty(float)
     def glow_intensity(self):
@@ -106,9 +133,11 @@ class HighlightFrame(QFrame):
 
     @glow_intensity.setter
     def glow_intensity(self, value):
+        # Quantize so animation ticks between steps don't re-blur the shadow
+        value = round(value * self.GLOW_STEPS) / self.GLOW_STEPS
+        if value == self._glow_intensity:
+            return
         self._glow_intensity = value
-        if self._use_shadow:
-            self._shadow_effect.setBlurRadius(value * 20)
         self.update()
 
     def set_active(self, active: bool):
@@ -119,12 +148,14 @@ class HighlightFrame(QFrame):
         self._is_active = active
 
         # Animate glow
+        if self._animation is None:
+            self._animation = QPropertyAnimation(self, b"glow_intensity")
+            self._animation.setDuration(200)
+            self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         self._animation.stop()
         if active:
             self._animation.setStartValue(self._glow_intensity)
             self._animation.setEndValue(1.0)
-            if self._use_shadow:
-                self.setGraphicsEffect(self._shadow_effect)
         else:
             self._animation.setStartValue(self._glow_intensity)
             self._animation.setEndValue(0.0)
@@ -134,6 +165,56 @@ class HighlightFrame(QFrame):
         # Update immediately
         self.update()
 
+    def _invalidate_border(self):
+        """Drop the pre-rendered border, rebuilt on the next paint"""
+        self._border_pixmap = None
+
+    def _build_border_pixmap(self) -> QPixmap:
+        """Render glow and border line for the current size and color"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        color = QColor(self._highlight_color)
+
+        if self._use_shadow:
+            rect = self.rect().toRectF()
+            # Faint outside, strongest next to the border line
+            for layer in range(self.GLOW_LAYERS):
+                inset = layer + 0.5
+                color.setAlphaF(0.75 * (layer + 1) / self.GLOW_LAYERS)
+                painter.setPen(QPen(color, 1.0))
+                painter.drawRoundedRect(
+                    rect.adjusted(inset, inset, -inset, -inset),
+                    self._border_radius, self._border_radius
+                )
+
+        # Rounded border line at full alpha
+        half = self._border_width // 2
+        path = QPainterPath()
+        path.addRoundedRect(
+            self.rect().adjusted(half, half, -half, -half).toRectF(),
+            self._border_radius, self._border_radius
+        )
+        color.setAlphaF(1.0)
+        painter.setPen(QPen(color, self._border_width))
+        painter.drawPath(path)
+        painter.end()
+
+        self._border_pixmap = pixmap
+        return pixmap
+
+    def resizeEvent(self, event):
+        """Re-place the content and drop the pre-rendered border"""
+        super().resizeEvent(event)
+        if self._content_widget is not None:
+            self._place_content()
+        self._invalidate_border()
+
     def is_active(self) -> bool:
         """Check if frame is active"""
         return self._is_active
@@ -145,30 +226,13 @@ class HighlightFrame(QFrame):
         if self._glow_intensity <= 0:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Calculate color with intensity
-        color = QColor(self._highlight_color)
-        color.setAlphaF(self._glow_intensity * 0.8)
-
-        # Draw rounded border
-        pen = QPen(color, self._border_width)
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-
-        # Create rounded rect path
-        rect = self.rect().adjusted(
-            self._border_width // 2,
-            self._border_width // 2,
-            -self._border_width // 2,
-            -self._border_width // 2
-        )
-
-        path = QPainterPath()
-        path.addRoundedRect(rect.toRectF(), self._border_radius, self._border_radius)
-        painter.drawPath(path)
+        pixmap = self._border_pixmap
+        if pixmap is None:
+            pixmap = self._build_border_pixmap()
 
+        painter = QPainter(self)
+        painter.setOpacity(self._glow_intensity * 0.8)
+        painter.drawPixmap(0, 0, pixmap)
         painter.end()
 
 
@@ -187,9 +251,16 @@ class HighlightManager:
 
     def __init__(self, highlight_color: str = "#3b82f6"):
         self._frames: dict[str, HighlightFrame] = {}
+        # id(content widget) -> name, for walking up from the focus widget
+        self._widget_to_name: dict[int, str] = {}
         self._active_name: str = None
         self._highlight_color = QColor(highlight_color)
 
+        # One global connection instead of per-widget focus tracking
+        app = QApplication.instance()
+        if app is not None:
+            app.focusChanged.connect(self._on_focus)
+
     def add_widget(self, widget: QWidget, name: str) -> HighlightFrame:
         """
         Wrap a widget in a HighlightFrame.
@@ -200,6 +271,7 @@ class HighlightManager:
         frame = HighlightFrame(widget)
         frame.set_highlight_color(self._highlight_color)
         self._frames[name] = frame
+        self._widget_to_name[id(widget)] = name
         return frame
 
     def get_frame(self, name: str) -> HighlightFrame:
@@ -231,15 +303,25 @@ class HighlightManager:
 
     def set_active_by_widget(self, widget: QWidget):
         """Set active based on which widget (or its child) has focus"""
-        for name, frame in self._frames.items():
-            content = frame.widget()
-            if content == widget or (content and content.isAncestorOf(widget)):
+        lookup = self._widget_to_name.get
+        frames = self._frames
+        w = widget
+        while w is not None:
+            name = lookup(id(w))
+            # The identity check guards against a reused id() of a deleted widget
+            if name is not None and frames[name].widget() is w:
                 self.set_active(name)
                 return
+            w = w.parentWidget()
 
         # No match found - deactivate all
         self.clear_active()
 
+    def _on_focus(self, old: QWidget, new: QWidget):
+        """QApplication.focusChanged handler"""
+        if new is not None:
+            self.set_active_by_widget(new)
+
     def clear_active(self):
         """Clear active state from all frames"""
         if self._active_name and self._active_name in self._frames:
@@ -1202,6 +1202,9 @@ class SettingsDialog(QDialog):
         self.term_cursor_blink.setChecked(True)
         misc_layout.addRow("", self.term_cursor_blink)
 
+        self.term_simple_renderer = QCheckBox(tr("Plain text renderer (faster for long output, new tabs)"))
+        misc_layout.addRow("", self.term_simple_renderer)
+
         layout.addWidget(misc_group)
         layout.addStretch()
 
@@ -1411,6 +1414,7 @@ class SettingsDialog(QDialog):
         self.term_scroll_on_input.setChecked(self.settings.value("term_scroll_on_input", True, type=bool))
         self.term_bell_enabled.setChecked(self.settings.value("term_bell_enabled", False, type=bool))
         self.term_cursor_blink.setChecked(self.settings.value("term_cursor_blink", True, type=bool))
+        self.term_simple_renderer.setChecked(self.settings.value("term_simple_renderer", False, type=bool))
 
         # Chat
         self.chat_default_model.setCurrentText(self.settings.value("chat_default_model", "auto"))
@@ -1503,6 +1507,7 @@ class SettingsDialog(QDialog):
         self.settings.setValue("term_scroll_on_input", self.term_scroll_on_input.isChecked())
         self.settings.setValue("term_bell_enabled", self.term_bell_enabled.isChecked())
         self.settings.setValue("term_cursor_blink", self.term_cursor_blink.isChecked())
+        self.settings.setValue("term_simple_renderer", self.term_simple_renderer.isChecked())
 
         # Chat
         self.settings.setValue("chat_default_model", self.chat_default_model.currentText())
@@ -9,17 +9,22 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QPlainTextEdit, QToolButton, QPushButton, QSizePolicy, QLabel
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QProcess
+from PyQt6.QtCore import (
+    Qt, QTimer, QProcess, QRect, QPointF, QSocketNotifier, QSettings
+)
 from PyQt6.QtGui import (
     QFont, QTextCursor, QColor, QKeyEvent, QTextCharFormat,
-    QPainter, QFontMetrics, QPalette
+    QPainter, QFontMetrics, QFontDatabase, QPalette
 )
+import codecs
 import os
+import re
 import sys
 import subprocess
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Windows ConPTY via winpty
 try:
@@ -38,90 +43,103 @@ except ImportError:
 logger = logging.getLogger("aiwindows.terminal_widget")
 
 
-class ConPTYReader(QThread):
-    """Thread for reading ConPTY output"""
-    data_ready = pyqtSignal(bytes)
-    finished = pyqtSignal(int)
-    
-    def __init__(self, pty_process):
-        super().__init__()
-        self.pty = pty_process
-        self._running = True
-    
-    def run(self):
-        """Read loop"""
-        while self._running and self.pty.isalive():
-            try:
-                data = self.pty.read(4096)
-                if data:
-                    self.data_ready.emit(data.encode() if isinstance(data, str) else data)
-            except Exception as e:
-                if self._running:
-                    logger.error(f"ConPTY read error: {e}")
-                break
-        
-        exit_code = self.pty.exitstatus or 0
-        self.finished.emit(exit_code)
-    
-    def stop(self):
-        self._running = False
+# Special keys -> VT sequences
+_KEY_MAP = {
+    Qt.Key.Key_Return: "\r",
+    Qt.Key.Key_Enter: "\r",
+    Qt.Key.Key_Backspace: "\x7f",
+    Qt.Key.Key_Tab: "\t",
+    Qt.Key.Key_Escape: "\x1b",
+    Qt.Key.Key_Up: "\x1b[A",
+    Qt.Key.Key_Down: "\x1b[B",
+    Qt.Key.Key_Right: "\x1b[C",
+    Qt.Key.Key_Left: "\x1b[D",
+    Qt.Key.Key_Home: "\x1b[H",
+    Qt.Key.Key_End: "\x1b[F",
+    Qt.Key.Key_PageUp: "\x1b[5~",
+    Qt.Key.Key_PageDown: "\x1b[6~",
+    Qt.Key.Key_Insert: "\x1b[2~",
+    Qt.Key.Key_Delete: "\x1b[3~",
+}
 
+# Ctrl+<key> -> control character
+_CTRL_KEY_MAP = {
+    Qt.Key.Key_C: "\x03",
+    Qt.Key.Key_D: "\x04",
+    Qt.Key.Key_Z: "\x1a",
+    Qt.Key.Key_L: "\x0c",
+}
+
+# Filler pywinpty's relay thread sends when a console read returned nothing
+_PTY_KEEPALIVE = b"0011Ignore"
+
+# Standard ANSI colors (Windows Terminal "Campbell" scheme)
+_HEX_16 = (
+    "#0c0c0c", "#c50f1f", "#13a10e", "#c19c00",
+    "#0037da", "#881798", "#3a96dd", "#cccccc",
+    "#767676", "#e74856", "#16c60c", "#f9f1a5",
+    "#3b78ff", "#b4009e", "#61d6d6", "#f2f2f2",
+)
+
+# pyte's names for the 16 ANSI colors, in palette order
+_PYTE_COLOR_NAMES = (
+    "black", "red", "green", "brown", "blue", "magenta", "cyan", "white",
+    "brightblack", "brightred", "brightgreen", "brightbrown",
+    "brightblue", "brightmagenta", "brightcyan", "brightwhite",
+)
 
-class WindowsTerminalCanvas(QWidget):
+
+def _pyte_hex_color(value) -> Optional[QColor]:
+    """QColor for a pyte 256/true color ("rrggbb"), None if not one"""
+    if isinstance(value, str) and len(value) == 6:
+        color = QColor("#" + value)
+        if color.isValid():
+            return color
+    return None
+
+
+# Escape handling for the plain-text backend: SGR is kept, everything else
+# (cursor movement, OSC titles, charset selection) is stripped
+_SGR_RE = re.compile(r'\x1b\[([0-9;]*)m')
+_NON_SGR_ESCAPE_RE = re.compile(
+    r'\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)'   # OSC ... BEL/ST
+    r'|\x1b\[[0-?]*[ -/]*[@-ln-~]'          # CSI other than SGR
+    r'|\x1b[()][0-9A-Za-z]|\x1b[=>78]'
+)
+_TRAILING_ESC_RE = re.compile(r'\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*|[()])?\Z')
+_CONTROL_STRIP_TABLE = str.maketrans("", "", "\r\x07\x08")
+
+
+@lru_cache(maxsize=1)
+def _terminal_font():
+    """Monospace terminal font and its (char width, char height).
+
+    Needs a QGuiApplication for the font database, so it is resolved on
+    first terminal creation rather than at import time.
     """
-    Terminal canvas with VT100 rendering for Windows.
-    Uses pyte for escape sequence handling.
+    family = "Cascadia Code" if "Cascadia Code" in QFontDatabase.families() else "Consolas"
+    font = QFont(family, 11)
+    font.setStyleHint(QFont.StyleHint.Monospace)
+    metrics = QFontMetrics(font)
+    return font, metrics.horizontalAdvance("W"), metrics.height()
+
+
+class _ConPTYSession:
+    """
+    ConPTY process plumbing shared by the terminal render backends.
+
+    Subclasses set cols/rows, call _init_session() from __init__ and
+    implement _on_data(bytes).
     """
     
-    # ANSI 256-color palette (standard)
-    COLORS_16 = [
-        "#0c0c0c", "#c50f1f", "#13a10e", "#c19c00",
-        "#0037da", "#881798", "#3a96dd", "#cccccc",
-        "#767676", "#e74856", "#16c60c", "#f9f1a5",
-        "#3b78ff", "#b4009e", "#61d6d6", "#f2f2f2"
-    ]
-    
-    def __init__(self, cols=120, rows=30, parent=None):
-        super().__init__(parent)
-        self.cols = cols
-        self.rows = rows
-        
-        # Font setup
-        self.term_font = QFont("Cascadia Code", 11)
-        if not QFontMetrics(self.term_font).horizontalAdvance("W"):
-            self.term_font = QFont("Consolas", 11)
-        self.term_font.setStyleHint(QFont.StyleHint.Monospace)
-        
-        metrics = QFontMetrics(self.term_font)
-        self.char_width = metrics.horizontalAdvance("W")
-        self.char_height = metrics.height()
-        
-        # Pyte screen
-        if HAS_PYTE:
-            self.screen = pyte.Screen(cols, rows)
-            self.stream = pyte.Stream(self.screen)
-        else:
-            self.screen = None
-            self.stream = None
-            self._buffer = []
-        
-        # ConPTY process
+    def _init_session(self):
         self.pty = None
-        self.reader = None
+        self._notifier: Optional[QSocketNotifier] = None
         self.pid = None
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         
         # Working directory
         self.working_dir = str(Path.home())
-        
-        # Focus
-        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.setMinimumSize(self.char_width * 80, self.char_height * 24)
-        
-        # Background
-        self.setAutoFillBackground(True)
-        pal = self.palette()
-        pal.setColor(QPalette.ColorRole.Window, QColor("#0c0c0c"))
-        self.setPalette(pal)
     
     def start(self, working_dir: str = None, shell: str = None):
         """Start ConPTY with PowerShell"""
@@ -142,28 +160,54 @@ class WindowsTerminalCanvas(QWidget):
                 dimensions=(self.rows, self.cols)
             )
             
-            # Start reader thread
-            self.reader = ConPTYReader(self.pty)
-            self.reader.data_ready.connect(self._on_data)
-            self.reader.finished.connect(self._on_finished)
-            self.reader.start()
+            # pywinpty relays the console output through a local socket;
+            # read it on the GUI thread whenever data is ready
+            self._notifier = QSocketNotifier(self.pty.fd, QSocketNotifier.Type.Read, self)
+            self._notifier.activated.connect(self._drain_pty)
             
             logger.info(f"ConPTY started: {shell}")
             
         except Exception as e:
             logger.error(f"Failed to start ConPTY: {e}")
     
-    def _on_data(self, data: bytes):
-        """Handle incoming data"""
+    def _drain_pty(self):
+        """Read whatever the PTY has ready"""
+        # Read the relay socket directly: PtyProcess.read() would decode to
+        # str, only for _on_data to need bytes again
         try:
-            text = data.decode("utf-8", errors="replace")
-            if self.stream:
-                self.stream.feed(text)
-            else:
-                self._buffer.append(text)
-            self.update()
-        except Exception as e:
-            logger.error(f"Data handling error: {e}")
+            data = self.pty.fileobj.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            # The notifier made the socket non-blocking; a spurious
+            # readiness signal just means there is nothing to read yet
+            return
+        except OSError as e:
+            # ConnectionError included: the relay side went away
+            logger.error(f"ConPTY read error: {e}")
+            data = b""
+        if not data:
+            # Socket closed: console exited
+            self._close_notifier()
+            self._on_finished(self.pty.exitstatus or 0)
+            return
+        if _PTY_KEEPALIVE in data:
+            data = data.replace(_PTY_KEEPALIVE, b"")
+        if data:
+            self._on_data(data)
+    
+    def _close_notifier(self):
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+    
+    def _decode_output(self, data) -> str:
+        """Decode PTY bytes, keeping multi-byte sequences across chunks"""
+        decoder = self._utf8_decoder
+        # Plain ASCII output (the common case) skips the UTF-8 decoder,
+        # unless it still holds a partial multi-byte sequence
+        if data.isascii() and not decoder.getstate()[0]:
+            return data.decode("latin-1")
+        return decoder.decode(data)
     
     def _on_finished(self, exit_code: int):
         """Terminal process finished"""
@@ -180,100 +224,254 @@ class WindowsTerminalCanvas(QWidget):
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard input"""
         key = event.key()
-        mods = event.modifiers()
-        text = event.text()
-        
-        # Special keys
-        key_map = {
-            Qt.Key.Key_Return: "\r",
-            Qt.Key.Key_Enter: "\r",
-            Qt.Key.Key_Backspace: "\x7f",
-            Qt.Key.Key_Tab: "\t",
-            Qt.Key.Key_Escape: "\x1b",
-            Qt.Key.Key_Up: "\x1b[A",
-            Qt.Key.Key_Down: "\x1b[B",
-            Qt.Key.Key_Right: "\x1b[C",
-            Qt.Key.Key_Left: "\x1b[D",
-            Qt.Key.Key_Home: "\x1b[H",
-            Qt.Key.Key_End: "\x1b[F",
-            Qt.Key.Key_PageUp: "\x1b[5~",
-            Qt.Key.Key_PageDown: "\x1b[6~",
-            Qt.Key.Key_Insert: "\x1b[2~",
-            Qt.Key.Key_Delete: "\x1b[3~",
-        }
-        
-        # Ctrl+C
-        if mods & Qt.KeyboardModifier.ControlModifier:
-            if key == Qt.Key.Key_C:
-                self._write("\x03")
-                return
-            elif key == Qt.Key.Key_D:
-                self._write("\x04")
-                return
-            elif key == Qt.Key.Key_Z:
-                self._write("\x1a")
-                return
-            elif key == Qt.Key.Key_L:
-                self._write("\x0c")
+        
+        # Ctrl+C, Ctrl+D, ...
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            seq = _CTRL_KEY_MAP.get(key)
+            if seq is not None:
+                self._write(seq)
                 return
         
-        if key in key_map:
-            self._write(key_map[key])
-        elif text:
-            self._write(text)
+        seq = _KEY_MAP.get(key)
+        if seq is not None:
+            self._write(seq)
+        else:
+            text = event.text()
+            if text:
+                self._write(text)
+    
+    def _resize_pty(self, rows: int, cols: int):
+        """Propagate a new terminal size to the console"""
+        if self.pty and self.pty.isalive():
+            try:
+                self.pty.setwinsize(rows, cols)
+            except:
+                pass
+    
+    def stop(self):
+        """Stop terminal"""
+        self._close_notifier()
+        
+        if self.pty and self.pty.isalive():
+            self.pty.terminate(force=True)
+
+
+class WindowsTerminalCanvas(_ConPTYSession, QWidget):
+    """
+    Terminal canvas with VT100 rendering for Windows.
+    Uses pyte for escape sequence handling.
+    """
+    
+    # ANSI 16-color palette, built once (QColor needs no QApplication)
+    COLORS_16 = tuple(QColor(h) for h in _HEX_16)
+    FG_DEFAULT = QColor("#cccccc")
+    BG_DEFAULT = QColor("#0c0c0c")
+    CURSOR_COLOR = QColor(255, 255, 255, 180)
+    
+    # pyte color keys: ANSI names (plus palette indices) -> QColor
+    _FG_TABLE = dict(zip(_PYTE_COLOR_NAMES, COLORS_16))
+    _FG_TABLE.update(enumerate(COLORS_16))
+    _FG_TABLE["default"] = FG_DEFAULT
+    _BG_TABLE = dict(_FG_TABLE, default=None)
+    
+    # PTY output is collected and fed/painted at most once per frame (~60 fps)
+    REPAINT_INTERVAL_MS = 16
+    CURSOR_BLINK_MS = 500
+    
+    def __init__(self, cols=120, rows=30, parent=None):
+        super().__init__(parent)
+        self.cols = cols
+        self.rows = rows
+        
+        # Output coalescing
+        self._pending = bytearray()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(self.REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._flush)
+        self._cursor_row = 0
+        
+        # Cursor blink only repaints the cursor cell
+        self._cursor_visible = True
+        self._blink_timer = QTimer(self)
+        self._blink_timer.setInterval(self.CURSOR_BLINK_MS)
+        self._blink_timer.timeout.connect(self._toggle_cursor)
+        if QSettings("AILinux", "Client").value("term_cursor_blink", True, type=bool):
+            self._blink_timer.start()
+        
+        # pyte color -> QColor (None: default background, nothing to fill);
+        # seeded with every named color, 256/true colors are added on first use
+        self._fg_table: Dict[object, QColor] = dict(self._FG_TABLE)
+        self._bg_table: Dict[object, Optional[QColor]] = dict(self._BG_TABLE)
+        # Row index -> coalesced paint runs, rebuilt only for dirty rows
+        self._row_runs: Dict[int, list] = {}
+        
+        # Font setup (resolved once per process)
+        self.term_font, self.char_width, self.char_height = _terminal_font()
+        
+        # Pyte screen
+        if HAS_PYTE:
+            self.screen = pyte.Screen(cols, rows)
+            self.stream = pyte.Stream(self.screen)
+        else:
+            self.screen = None
+            self.stream = None
+            self._buffer = []
+        
+        # ConPTY process
+        self._init_session()
+        
+        # Focus
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setMinimumSize(self.char_width * 80, self.char_height * 24)
+        
+        # Background
+        self.setAutoFillBackground(True)
+        pal = self.palette()
+        pal.setColor(QPalette.ColorRole.Window, self.BG_DEFAULT)
+        self.setPalette(pal)
+    
+    def _on_data(self, data: bytes):
+        """Handle incoming data (buffered until the next frame)"""
+        self._pending += data
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def _flush(self):
+        """Feed buffered output to the emulator and repaint the changed rows"""
+        if not self._pending:
+            return
+        try:
+            text = self._decode_output(self._pending)
+            self._pending.clear()
+            if not self.stream:
+                self._buffer.append(text)
+                self.update()
+                return
+            
+            self.stream.feed(text)
+            # Keep the cursor solid while output arrives
+            self._cursor_visible = True
+            if self._blink_timer.isActive():
+                self._blink_timer.start()
+            dirty = self.screen.dirty
+            # Old and new cursor row need repainting even without new text
+            dirty.add(self._cursor_row)
+            self._cursor_row = self.screen.cursor.y
+            dirty.add(self._cursor_row)
+            ch = self.char_height
+            top = min(dirty)
+            row_runs = self._row_runs
+            for row_idx in dirty:
+                row_runs.pop(row_idx, None)
+            self.update(QRect(0, top * ch, self.width(), (max(dirty) - top + 1) * ch))
+            dirty.clear()
+        except Exception as e:
+            logger.error(f"Data handling error: {e}")
     
     def paintEvent(self, event):
         """Render terminal screen"""
         painter = QPainter(self)
         painter.setFont(self.term_font)
         
-        # Background
-        painter.fillRect(self.rect(), QColor("#0c0c0c"))
+        # Background (only the requested region)
+        area = event.rect()
+        painter.fillRect(area, self.BG_DEFAULT)
         
         if not self.screen:
             # Fallback ohne pyte
-            painter.setPen(QColor("#cccccc"))
+            painter.setPen(self.FG_DEFAULT)
             y = self.char_height
             for line in self._buffer[-self.rows:]:
                 painter.drawText(5, y, line.rstrip())
                 y += self.char_height
             return
         
-        # Render pyte screen
-        for row_idx, row in enumerate(self.screen.buffer):
-            y = (row_idx + 1) * self.char_height
-            x = 0
-            
-            for col_idx, char in enumerate(row):
-                # Get character attributes
-                fg = char.fg if char.fg != "default" else "white"
-                bg = char.bg if char.bg != "default" else "default"
-                
-                # Map color
-                if isinstance(fg, int) and fg < 16:
-                    fg_color = QColor(self.COLORS_16[fg])
-                elif fg == "white":
-                    fg_color = QColor("#cccccc")
-                else:
-                    fg_color = QColor("#cccccc")
-                
-                if bg != "default":
-                    if isinstance(bg, int) and bg < 16:
-                        bg_color = QColor(self.COLORS_16[bg])
-                        painter.fillRect(x, row_idx * self.char_height, 
-                                        self.char_width, self.char_height, bg_color)
-                
-                painter.setPen(fg_color)
-                painter.drawText(x, y - 3, char.data)
-                x += self.char_width
-        
-        # Cursor
+        # Render pyte screen, rows intersecting the update region only
+        buffer = self.screen.buffer
+        first_row = max(0, area.top() // self.char_height)
+        last_row = min(self.rows - 1, area.bottom() // self.char_height)
+        row_runs = self._row_runs
+        cw = self.char_width
+        ch = self.char_height
+        for row_idx in range(first_row, last_row + 1):
+            runs = row_runs.get(row_idx)
+            if runs is None:
+                runs = row_runs[row_idx] = self._build_runs(buffer[row_idx])
+            top = row_idx * ch
+            baseline = top + ch - 3
+            for col, length, fg_color, bg_color, text in runs:
+                x = col * cw
+                if bg_color is not None:
+                    painter.fillRect(x, top, length * cw, ch, bg_color)
+                if text:
+                    painter.setPen(fg_color)
+                    painter.drawText(QPointF(x, baseline), text)
+        
+        # Cursor: outline, so the glyph underneath stays untouched
+        if self._cursor_visible:
+            rect = self._cursor_rect()
+            if rect is not None:
+                painter.setPen(self.CURSOR_COLOR)
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRect(rect.adjusted(0, 0, -1, -1))
+    
+    def _cursor_rect(self) -> Optional[QRect]:
+        """Cell rectangle of the pyte cursor, None when off screen"""
         cursor = self.screen.cursor
         if 0 <= cursor.y < self.rows and 0 <= cursor.x < self.cols:
-            cx = cursor.x * self.char_width
-            cy = cursor.y * self.char_height
-            painter.fillRect(cx, cy, self.char_width, self.char_height, 
-                           QColor(255, 255, 255, 180))
+            return QRect(cursor.x * self.char_width, cursor.y * self.char_height,
+                         self.char_width, self.char_height)
+        return None
+    
+    def _toggle_cursor(self):
+        """Blink tick: repaint just the cursor cell"""
+        if not self.screen:
+            return
+        self._cursor_visible = not self._cursor_visible
+        rect = self._cursor_rect()
+        if rect is not None:
+            self.update(rect)
+    
+    def _build_runs(self, row) -> list:
+        """Coalesce a pyte row into (col, length, fg, bg, text) runs of equal colors"""
+        runs = []
+        append = runs.append
+        fg_color = self._fg_color
+        bg_color = self._bg_color
+        run_start = 0
+        run_chars = []
+        attrs = None
+        for col_idx in range(self.cols):
+            char = row[col_idx]
+            cell_attrs = (char.fg, char.bg)
+            if cell_attrs != attrs:
+                if run_chars:
+                    append((run_start, len(run_chars), fg_color(attrs[0]),
+                            bg_color(attrs[1]), "".join(run_chars).rstrip()))
+                attrs = cell_attrs
+                run_start = col_idx
+                run_chars = []
+            run_chars.append(char.data)
+        if run_chars:
+            append((run_start, len(run_chars), fg_color(attrs[0]),
+                    bg_color(attrs[1]), "".join(run_chars).rstrip()))
+        return runs
+    
+    def _fg_color(self, fg) -> QColor:
+        """Foreground QColor for a pyte color"""
+        color = self._fg_table.get(fg)
+        if color is None:
+            color = self._fg_table[fg] = _pyte_hex_color(fg) or self.FG_DEFAULT
+        return color
+    
+    def _bg_color(self, bg) -> Optional[QColor]:
+        """Background QColor for a pyte color, None for the default background"""
+        table = self._bg_table
+        if bg in table:
+            return table[bg]
+        color = table[bg] = _pyte_hex_color(bg)
+        return color
     
     def resizeEvent(self, event):
         """Handle resize"""
@@ -287,21 +485,131 @@ class WindowsTerminalCanvas(QWidget):
             
             if self.screen:
                 self.screen.resize(new_rows, new_cols)
+                self._row_runs.clear()
             
-            if self.pty and self.pty.isalive():
-                try:
-                    self.pty.setwinsize(new_rows, new_cols)
-                except:
-                    pass
+            self._resize_pty(new_rows, new_cols)
+
+
+class WindowsTerminalCanvasSimple(_ConPTYSession, QPlainTextEdit):
+    """
+    Append-only terminal view on QPlainTextEdit.
+
+    Uses Qt's native text rendering and block recycling instead of
+    painting a pyte screen cell by cell, which suits long-running output
+    (logs, builds). Only SGR color sequences are interpreted; cursor
+    addressing is dropped, so full-screen programs need the canvas.
+    """
     
-    def stop(self):
-        """Stop terminal"""
-        if self.reader:
-            self.reader.stop()
-            self.reader.wait(1000)
+    # Lines kept before the oldest are recycled
+    MAX_BLOCKS = 5000
+    
+    def __init__(self, cols=120, rows=30, parent=None):
+        super().__init__(parent)
+        self.cols = cols
+        self.rows = rows
+        self._init_session()
+        self._esc_tail = ""
         
-        if self.pty and self.pty.isalive():
-            self.pty.terminate(force=True)
+        font, self.char_width, self.char_height = _terminal_font()
+        self.setFont(font)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.document().setMaximumBlockCount(self.MAX_BLOCKS)
+        
+        pal = self.palette()
+        pal.setColor(QPalette.ColorRole.Base, WindowsTerminalCanvas.BG_DEFAULT)
+        pal.setColor(QPalette.ColorRole.Text, WindowsTerminalCanvas.FG_DEFAULT)
+        self.setPalette(pal)
+        
+        self._base_format = QTextCharFormat()
+        self._base_format.setForeground(WindowsTerminalCanvas.FG_DEFAULT)
+        self._format = QTextCharFormat(self._base_format)
+        self._append_cursor = QTextCursor(self.document())
+    
+    def _on_data(self, data: bytes):
+        """Append output, translating SGR colors into character formats"""
+        text = self._esc_tail + self._decode_output(data)
+        # Hold back an escape sequence split across reads
+        tail = _TRAILING_ESC_RE.search(text)
+        if tail:
+            self._esc_tail = tail.group()
+            text = text[:tail.start()]
+        else:
+            self._esc_tail = ""
+        text = _NON_SGR_ESCAPE_RE.sub("", text.replace("\r\n", "\n")).translate(_CONTROL_STRIP_TABLE)
+        if not text:
+            return
+        
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        cursor = self._append_cursor
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # re.split with a group alternates text, SGR params, text, ...
+        for i, part in enumerate(_SGR_RE.split(text)):
+            if i % 2:
+                self._apply_sgr(part)
+            elif part:
+                cursor.insertText(part, self._format)
+        cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _apply_sgr(self, params: str):
+        """Update the current character format from SGR parameters"""
+        colors = WindowsTerminalCanvas.COLORS_16
+        fmt = self._format
+        codes = [int(c) for c in params.split(";") if c.isdigit()] or [0]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            if code == 0:
+                fmt = QTextCharFormat(self._base_format)
+            elif code == 1:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            elif code == 22:
+                fmt.setFontWeight(QFont.Weight.Normal)
+            elif 30 <= code <= 37:
+                fmt.setForeground(colors[code - 30])
+            elif 90 <= code <= 97:
+                fmt.setForeground(colors[code - 82])
+            elif code == 39:
+                fmt.setForeground(WindowsTerminalCanvas.FG_DEFAULT)
+            elif 40 <= code <= 47:
+                fmt.setBackground(colors[code - 40])
+            elif 100 <= code <= 107:
+                fmt.setBackground(colors[code - 92])
+            elif code == 49:
+                fmt.clearBackground()
+            elif code in (38, 48) and i + 1 < len(codes):
+                # Extended colors: 5;n (palette) or 2;r;g;b
+                color = None
+                if codes[i + 1] == 5 and i + 2 < len(codes):
+                    n = codes[i + 2]
+                    color = colors[n] if n < 16 else None
+                    i += 2
+                elif codes[i + 1] == 2 and i + 4 < len(codes):
+                    color = QColor(codes[i + 2], codes[i + 3], codes[i + 4])
+                    i += 4
+                if color is not None:
+                    if code == 38:
+                        fmt.setForeground(color)
+                    else:
+                        fmt.setBackground(color)
+            i += 1
+        self._format = fmt
+    
+    def resizeEvent(self, event):
+        """Handle resize"""
+        super().resizeEvent(event)
+        viewport = self.viewport()
+        new_cols = max(80, viewport.width() // self.char_width)
+        new_rows = max(24, viewport.height() // self.char_height)
+        if new_cols != self.cols or new_rows != self.rows:
+            self.cols = new_cols
+            self.rows = new_rows
+            self._resize_pty(new_rows, new_cols)
 
 
 class TerminalTabWidget(QWidget):
@@ -350,7 +658,10 @@ class TerminalTabWidget(QWidget):
     
     def _add_terminal(self, shell: str = "powershell.exe"):
         """Add new terminal tab"""
-        terminal = WindowsTerminalCanvas(parent=self)
+        if QSettings("AILinux", "Client").value("term_simple_renderer", False, type=bool):
+            terminal = WindowsTerminalCanvasSimple(parent=self)
+        else:
+            terminal = WindowsTerminalCanvas(parent=self)
         
         shell_name = "PowerShell" if "powershell" in shell.lower() else "CMD"
         idx = self.tabs.addTab(terminal, f"{shell_name} {self.tabs.count() + 1}")
@@ -362,7 +673,7 @@ class TerminalTabWidget(QWidget):
     def _close_tab(self, index: int):
         """Close terminal tab"""
         widget = self.tabs.widget(index)
-        if isinstance(widget, WindowsTerminalCanvas):
+        if isinstance(widget, _ConPTYSession):
             widget.stop()
         self.tabs.removeTab(index)
         
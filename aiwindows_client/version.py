@@ -3,32 +3,39 @@ AIWindows Client Version
 ========================
 Windows-Version des AILinux Desktop Clients
 """
+import os
+from functools import cache
+from pathlib import Path
 
 VERSION = "1.0.0"
 BUILD_DATE = "20251217"
 PLATFORM = "windows"
 
-CHANGELOG = """
-# AIWindows Client Changelog
+# Windows-spezifische Pfade
+DEFAULT_SHELL = "powershell.exe"
 
-## Version 1.0.0 (2025-12-17)
+_CHANGELOG_PATH = Path(__file__).parent / "assets" / "CHANGELOG.md"
 
-### Neu
-- Erste Windows-Version
-- PowerShell Terminal Integration
-- Windows File Browser mit Laufwerks-Support
-- AI Chat (identisch mit Linux-Version)
-- Web Browser Integration
-- Auto-Update System
 
-### Features
-- Tier-System (Free/Pro) wie Linux
-- Ollama Integration
-- Cloud-Modelle (Claude, Gemini, GPT)
-- MCP Node Support
-"""
+@cache
+def default_home() -> str:
+    """User home directory, resolved on first use"""
+    return os.path.expanduser("~")
 
-# Windows-spezifische Pfade
-import os
-DEFAULT_HOME = os.path.expanduser("~")
-DEFAULT_SHELL = "powershell.exe"
+
+@cache
+def changelog() -> str:
+    """Changelog text, read from the packaged CHANGELOG.md on first use"""
+    try:
+        return _CHANGELOG_PATH.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+def __getattr__(name):
+    # CHANGELOG / DEFAULT_HOME stay importable, but are only built when asked for
+    if name == "CHANGELOG":
+        return changelog()
+    if name == "DEFAULT_HOME":
+        return default_home()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,75 @@
+"""
+Regression checks for the fallback markdown renderer.
+
+The single-pass renderer must produce the same HTML as the original
+regex chain for inline markup within a line.
+"""
+import re
+import unittest
+
+from aiwindows_client.core.markdown_renderer import _fallback_render, _render_inline
+
+
+def _regex_inline(text: str) -> str:
+    """Inline passes of the original regex renderer"""
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+    return re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+
+
+def _regex_render(text: str) -> str:
+    """Original regex-based fallback renderer (fence-free input)"""
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    text = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', text, flags=re.MULTILINE)
+    text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
+    text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
+    text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
+    text = _regex_inline(text)
+    text = re.sub(r'^- (.+)$', r'<li>\1</li>', text, flags=re.MULTILINE)
+    text = text.replace('\n\n', '</p><p>')
+    text = text.replace('\n', '<br>')
+    return f'<p>{text}</p>'
+
+
+class InlineRenderTest(unittest.TestCase):
+
+    LINES = [
+        "* **Step 1**: install",
+        "2 * 3 = **6**",
+        "2 * 3 * 4",
+        "a ** b",
+        "**bold** and *italic* and `code`",
+        "*a **b** c*",
+        "`a*b*c` *x*",
+        "- **Note:** run `make` * twice",
+        "***both***",
+        "unmatched * and ` markers",
+    ]
+
+    def test_matches_regex_renderer(self):
+        for line in self.LINES:
+            with self.subTest(line=line):
+                self.assertEqual(_render_inline(line), _regex_inline(line))
+
+    def test_lone_star_stays_literal(self):
+        self.assertEqual(_render_inline("2 * 3 = **6**"), "2 * 3 = <strong>6</strong>")
+
+
+class FallbackRenderTest(unittest.TestCase):
+
+    TEXTS = [
+        "* **Step 1**: install\n* **Step 2**: run",
+        "- **a** * b\n- 2 * 3 = **6**",
+        "# Title *x*\n\nSome **bold** text\nnext line",
+        "## Result\n1. 4 * 5 = **20**\n2. done",
+        "a & b < c > d\n\n\n- item",
+    ]
+
+    def test_matches_regex_renderer(self):
+        for text in self.TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(_fallback_render(text), _regex_render(text))
+
+
+if __name__ == "__main__":
+    unittest.main()